@@ -61,6 +61,11 @@ class Settings(BaseSettings):
         description="Jira API token",
         validation_alias=AliasChoices("JIRA_API_TOKEN", "JIRA_API_KEY"),
     )
+    jira_cache_ttl_seconds: int = Field(
+        default=45,
+        description="TTL for cached Jira GET responses in seconds (0 disables caching)",
+        validation_alias=AliasChoices("JIRA_CACHE_TTL", "JIRA_CACHE_TTL_SECONDS"),
+    )
 
     # GitHub
     github_token: Optional[str] = Field(
@@ -0,0 +1,39 @@
+"""Compiled glob matching shared by the filesystem and GitHub listing tools."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from typing import Callable
+
+
+def _fast_match(key: str) -> Callable[[str], bool]:
+    """Return a predicate for an already normcase'd glob.
+
+    Literals and single-star globs ("*", "*.py", "test_*", "a*b") reduce to
+    string comparisons; anything with "?", "[" or several stars is matched
+    with the translated regex, compiled once.
+    """
+    if "?" in key or "[" in key or key.count("*") > 1:
+        regex_match = re.compile(fnmatch.translate(key)).match
+        return lambda name: regex_match(name) is not None
+    if "*" not in key:
+        return lambda name: name == key
+
+    prefix, suffix = key.split("*")
+    if not suffix:
+        return lambda name: name.startswith(prefix)
+    if not prefix:
+        return lambda name: name.endswith(suffix)
+    min_len = len(prefix) + len(suffix)
+    return lambda name: len(name) >= min_len and name.startswith(prefix) and name.endswith(suffix)
+
+
+def glob_matcher(pattern: str) -> Callable[[str], bool]:
+    """Compile a glob once into a predicate matching `fnmatch.fnmatch` semantics."""
+    test = _fast_match(os.path.normcase(pattern))
+    if os.name != "nt":
+        return test
+    # fnmatch normalizes case and separators on Windows
+    return lambda name: test(os.path.normcase(name))
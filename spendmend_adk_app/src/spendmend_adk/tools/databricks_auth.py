@@ -0,0 +1,65 @@
+"""Databricks token resolution shared by the SQL tools and OpenAPI toolsets.
+
+Kept free of the Databricks SQL connector so importing it only needs settings.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from spendmend_adk.settings import settings
+
+
+# How long a token resolved through a profile is reused; bounded so a rotated
+# or expired token in ~/.databrickscfg is picked up without a restart
+DATABRICKS_TOKEN_CACHE_TTL_SECONDS = 15 * 60
+
+# (host, profile, explicit token) settings -> (resolved at, profile token)
+_TOKEN_CACHE: Dict[Tuple[Optional[str], str, Optional[str]], Tuple[float, str]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+
+def _profile_token(profile: str) -> Optional[str]:
+    try:
+        from databricks.sdk import WorkspaceClient  # type: ignore
+
+        client = WorkspaceClient(profile=profile)
+        return getattr(getattr(client, "config", None), "token", None)
+    except Exception:
+        return None
+
+
+def resolve_databricks_token() -> str:
+    """Resolve the Databricks token from settings.
+
+    Preference order:
+      1) WorkspaceClient(profile=...) if databricks-sdk is installed
+      2) Explicit env token (DATABRICKS_TOKEN/DBX_TOKEN)
+
+    Building a WorkspaceClient parses ~/.databrickscfg and may authenticate, so a
+    token found through the profile is reused for DATABRICKS_TOKEN_CACHE_TTL_SECONDS,
+    keyed on the current host/profile/token settings. Failed lookups aren't cached.
+    """
+    profile = settings.databricks_profile
+    if profile:
+        key = (settings.databricks_host, profile, settings.databricks_token)
+        with _TOKEN_CACHE_LOCK:
+            hit = _TOKEN_CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < DATABRICKS_TOKEN_CACHE_TTL_SECONDS:
+            return hit[1]
+
+        token = _profile_token(profile)
+        if token:
+            with _TOKEN_CACHE_LOCK:
+                _TOKEN_CACHE[key] = (time.monotonic(), token)
+            return token
+
+    if settings.databricks_token:
+        return settings.databricks_token
+    if profile:
+        raise ValueError(
+            "Missing Databricks token (set DATABRICKS_TOKEN) and unable to resolve from profile."
+        )
+    raise ValueError("Missing Databricks token (set DATABRICKS_TOKEN).")
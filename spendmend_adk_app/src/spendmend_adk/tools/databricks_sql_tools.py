@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple
 from databricks import sql as dbsql
 
 from spendmend_adk.settings import settings
+from spendmend_adk.tools.databricks_auth import resolve_databricks_token
 
 
 def _normalize_databricks_host(host: str) -> str:
@@ -23,28 +24,10 @@ def _server_hostname_from_host(host: str) -> str:
     return host
 
 
-def _resolve_databricks_token() -> str:
-    profile = settings.databricks_profile
-    if profile:
-        try:
-            from databricks.sdk import WorkspaceClient  # type: ignore
-
-            client = WorkspaceClient(profile=profile)
-            token = getattr(getattr(client, "config", None), "token", None)
-            if token:
-                return token
-        except Exception:
-            pass
-
-    if settings.databricks_token:
-        return settings.databricks_token
-    raise ValueError("Missing Databricks token (set DATABRICKS_TOKEN).")
-
-
 def _connect_sql_warehouse(http_path: str):
     if not settings.databricks_host:
         raise ValueError("Missing Databricks host (set DATABRICKS_HOST).")
-    token = _resolve_databricks_token()
+    token = resolve_databricks_token()
     return dbsql.connect(
         server_hostname=_server_hostname_from_host(settings.databricks_host),
         http_path=http_path,
@@ -7,7 +7,7 @@ status for success/failure rather than raising exceptions.
 Safety Guards (Section E):
 - Repo-root allowlist: ALLOWED_REPO_ROOTS env var, checked on every operation
 - Max file size: 1MB read, 500KB write
-- Binary detection: Check magic bytes, reject if binary
+- Binary detection: Known extensions, else magic bytes; reject if binary
 - Path traversal: Resolve symlinks, reject if outside allowlist
 - Backup on write: Create .bak before overwrite
 
@@ -16,19 +16,26 @@ Tool Signature Pattern:
     where `args` contains the tool parameters and `tool_context` provides ADK context.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
+import atexit
+import difflib
+import mmap
 import os
+import re
 import stat
 import subprocess
 import tempfile
-import fnmatch
+import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 from spendmend_adk.settings import settings
+from spendmend_adk.tools._glob import glob_matcher
 
 
 # =============================================================================
@@ -41,6 +48,12 @@ MAX_WRITE_FILE_SIZE = 500 * 1024  # 500 KB (Section E safety guard)
 DEFAULT_ENCODING = "utf-8"
 MAX_DIRECTORY_ENTRIES = 10000
 MAX_RECURSION_DEPTH = 20
+INPROCESS_PATCH_MAX_SIZE = 64 * 1024  # Larger patches go straight to git/patch
+PARALLEL_LISTING_MIN_FANOUT = 4  # Subdirectory count above which subtrees are listed concurrently
+PARALLEL_STAT_MIN_ENTRIES = 256  # Directory size above which entry stats are batched on the I/O pool
+STAT_BATCH_SIZE = 64
+BINARY_CHECK_BYTES = 8192
+NEWLINE_COUNT_CHUNK = 64 * 1024
 
 # Binary file detection: common binary file magic bytes
 BINARY_MAGIC_BYTES = [
@@ -56,6 +69,49 @@ BINARY_MAGIC_BYTES = [
     b'%PDF',        # PDF files
 ]
 
+# Patch tool output parsing (matched on raw bytes; only captured spans are decoded)
+_GIT_APPLIED_RE = re.compile(rb"^Applied patch (\S+)", re.MULTILINE)
+_GIT_CONFLICT_RE = re.compile(rb"^.*(?:error:|conflict).*$", re.IGNORECASE | re.MULTILINE)
+_PATCHING_FILE_RE = re.compile(rb"patching file (\S+)", re.IGNORECASE)
+_PATCH_CONFLICT_RE = re.compile(rb"^.*(?:reject|failed|hunk).*$", re.IGNORECASE | re.MULTILINE)
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+# Patch headers the in-process applier does not handle (delegated to git/patch)
+_UNSUPPORTED_PATCH_HEADERS = (
+    "new file mode",
+    "deleted file mode",
+    "old mode",
+    "new mode",
+    "rename ",
+    "copy ",
+    "similarity index",
+    "dissimilarity index",
+    "Binary files",
+    "GIT binary patch",
+)
+
+# Extensions that skip binary detection entirely (always treated as text)
+TEXT_FILE_EXTENSIONS = frozenset({
+    ".py", ".md", ".txt", ".json", ".yaml", ".yml", ".toml", ".rst", ".cfg", ".ini",
+    ".html", ".css", ".js", ".ts", ".c", ".h", ".cpp", ".hpp", ".rs", ".go", ".java",
+    ".sh", ".sql",
+})
+
+# Extensions rejected as binary without reading the file
+BINARY_FILE_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".pdf", ".zip", ".gz", ".bz2",
+    ".so", ".dll", ".exe", ".pyc", ".whl",
+})
+
+
+# Shared pool for parallel file I/O, reused across tool calls so per-call work
+# doesn't pay thread start-up cost. Threads are only spawned on first use.
+_IO_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 2) * 4),
+    thread_name_prefix="local-fs-io",
+)
+atexit.register(_IO_POOL.shutdown, wait=False)
+
 
 # =============================================================================
 # PatchResult Schema (Section E2)
@@ -106,44 +162,61 @@ def _get_allowed_repo_roots() -> List[Path]:
     return [_get_workspace_root()]
 
 
-def _is_binary_file(path: Path, check_bytes: int = 8192) -> bool:
-    """Check if a file appears to be binary.
-
-    Uses magic bytes detection and null byte scanning to identify binary files.
+def _looks_binary(chunk: bytes) -> bool:
+    """Classify a leading sample of file content as binary or text."""
+    # Check magic bytes
+    for magic in BINARY_MAGIC_BYTES:
+        if chunk.startswith(magic):
+            return True
 
-    Args:
-        path: Path to the file to check
-        check_bytes: Number of bytes to read for checking
+    # Check for null bytes
+    if b'\x00' in chunk:
+        return True
 
-    Returns:
-        True if the file appears to be binary
-    """
+    # Try to decode as UTF-8
     try:
-        with open(path, "rb") as f:
-            header = f.read(min(check_bytes, 8))
+        chunk.decode("utf-8")
+        return False
+    except UnicodeDecodeError:
+        # Contains non-UTF-8 bytes, likely binary
+        return True
 
-            # Check magic bytes
-            for magic in BINARY_MAGIC_BYTES:
-                if header.startswith(magic):
-                    return True
 
-            # Read more content and check for null bytes
-            f.seek(0)
-            chunk = f.read(check_bytes)
-            if b'\x00' in chunk:
-                return True
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a file's contents and metadata.
 
-            # Try to decode as UTF-8
+    Uses `os.copy_file_range` where available so the data never enters user
+    space and the GIL is released for the whole transfer. Falls back to
+    `shutil.copy2` when the kernel or filesystem does not support it.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            src_fd = os.open(src, os.O_RDONLY)
             try:
-                chunk.decode("utf-8")
-                return False
-            except UnicodeDecodeError:
-                # Contains non-UTF-8 bytes, likely binary
-                return True
+                st = os.fstat(src_fd)
+                dst_fd = os.open(
+                    dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IMODE(st.st_mode)
+                )
+                try:
+                    remaining = st.st_size
+                    while remaining > 0:
+                        copied = copy_file_range(src_fd, dst_fd, remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            # e.g. EXDEV/ENOSYS/EINVAL on older kernels or special filesystems
+            pass
 
-    except Exception:
-        # On error, assume binary for safety
-        return True
+    shutil.copy2(src, dst)
 
 
 def _create_backup(path: Path) -> Optional[str]:
@@ -168,7 +241,7 @@ def _create_backup(path: Path) -> Optional[str]:
         backup_path = path.with_suffix(f"{path.suffix}.{timestamp}.bak")
 
     try:
-        shutil.copy2(path, backup_path)
+        _copy_file(path, backup_path)
         return str(backup_path)
     except Exception as e:
         # Log but don't fail - backup is a safety measure
@@ -177,27 +250,58 @@ def _create_backup(path: Path) -> Optional[str]:
         return None
 
 
-def _check_in_allowed_roots(path: Path) -> tuple[bool, str]:
+@lru_cache(maxsize=4096)
+def _check_parent_allowed(parent_str: str, roots_key: tuple[str, ...]) -> bool:
+    """Check (cached) whether a directory lies within any allowed root.
+
+    Patch files frequently share parent directories, so containment is cached
+    per unique (parent, roots) pair rather than recomputed for every file.
+
+    Args:
+        parent_str: Resolved absolute directory path as a string
+        roots_key: Resolved allowed roots as strings
+
+    Returns:
+        True if the directory is within (or equal to) an allowed root
+    """
+    parent = Path(parent_str)
+    for root in roots_key:
+        try:
+            parent.relative_to(root)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+def _allowed_roots_key() -> tuple[str, ...]:
+    """Get the allowed repository roots as a hashable cache key."""
+    return tuple(str(r) for r in _get_allowed_repo_roots())
+
+
+def _check_in_allowed_roots(
+    path: Path, roots_key: Optional[tuple[str, ...]] = None
+) -> tuple[bool, str]:
     """Check if a path is within any allowed repository root.
 
     Args:
         path: Resolved absolute path to check
+        roots_key: Precomputed result of `_allowed_roots_key()`; callers checking
+            many paths should compute it once and pass it in
 
     Returns:
         Tuple of (is_allowed, error_message)
     """
-    allowed_roots = _get_allowed_repo_roots()
+    if roots_key is None:
+        roots_key = _allowed_roots_key()
 
-    for root in allowed_roots:
-        try:
-            path.relative_to(root)
-            return (True, "")
-        except ValueError:
-            continue
+    # A root itself is allowed even though its parent is not
+    if str(path) in roots_key or _check_parent_allowed(str(path.parent), roots_key):
+        return (True, "")
 
     return (
         False,
-        f"Path '{path}' is not within allowed repo roots: {[str(r) for r in allowed_roots]}",
+        f"Path '{path}' is not within allowed repo roots: {list(roots_key)}",
     )
 
 
@@ -236,6 +340,100 @@ def _validate_path_in_sandbox(path: str) -> tuple[bool, str, Optional[Path]]:
     return True, "", resolved
 
 
+def _safe_stat(path: Path) -> Optional[os.stat_result]:
+    """Stat a path without following a final symlink.
+
+    One `lstat` answers existence, type and size together, instead of separate
+    `exists()`, `is_file()` and `stat()` calls.
+
+    Returns:
+        The stat result, or None if the path does not exist
+    """
+    try:
+        return os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _truncate_lines(text: str, max_lines: int) -> tuple[str, bool]:
+    """Keep only the first `max_lines` lines of text.
+
+    Scans forward with `str.find` so only the kept prefix is walked, instead of
+    splitting the whole text into a list of lines.
+
+    Args:
+        text: Text to truncate
+        max_lines: Number of lines to keep
+
+    Returns:
+        Tuple of (kept_text, was_truncated)
+    """
+    idx = -1
+    for _ in range(max_lines):
+        idx = text.find("\n", idx + 1)
+        if idx < 0:
+            return text, False
+    return text[:idx], True
+
+
+@lru_cache(maxsize=32)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Check whether line breaks encode to their ASCII bytes in `encoding`."""
+    try:
+        return "\r\n".encode(encoding) == b"\r\n"
+    except LookupError:
+        return False
+
+
+def _count_newlines(buf: mmap.mmap) -> int:
+    """Count newline bytes in a mapped file, copying at most one chunk at a time."""
+    return sum(
+        buf[i : i + NEWLINE_COUNT_CHUNK].count(b"\n")
+        for i in range(0, len(buf), NEWLINE_COUNT_CHUNK)
+    )
+
+
+def _decode_mapped_text(
+    buf: mmap.mmap, encoding: str, max_lines: Optional[int]
+) -> tuple[str, int]:
+    """Decode a memory-mapped text file, keeping at most `max_lines` lines.
+
+    Line endings are normalized as in text-mode reads. When the
+    encoding is ASCII-compatible and the file has no carriage returns, the cut
+    point is found on the raw bytes so only the kept prefix is decoded.
+
+    Args:
+        buf: Read-only mapping of the file
+        encoding: Text encoding
+        max_lines: Number of lines to keep (falsy or <= 0 for no limit)
+
+    Returns:
+        Tuple of (text, total_lines); total_lines is 0 when nothing was truncated
+    """
+    limit = max_lines if max_lines and max_lines > 0 else 0
+
+    if limit and _is_ascii_compatible(encoding) and buf.find(b"\r") < 0:
+        end = -1
+        for _ in range(limit):
+            end = buf.find(b"\n", end + 1)
+            if end < 0:
+                break
+        if end >= 0:
+            with memoryview(buf)[:end] as view:
+                return str(view, encoding), _count_newlines(buf) + 1
+
+    with memoryview(buf) as view:
+        text = str(view, encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+    if limit:
+        kept, truncated = _truncate_lines(text, limit)
+        if truncated:
+            return kept, text.count("\n") + 1
+    return text, 0
+
+
 def read_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     """
     Safely read a file from the local workspace.
@@ -243,7 +441,7 @@ def read_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     Safety guards enforced:
     - Path must be within allowed repo roots
     - Maximum file size: 1MB (configurable)
-    - Binary files are rejected
+    - Binary files are rejected (by extension, else by content sniffing)
 
     Args:
         args: Dictionary containing:
@@ -279,18 +477,19 @@ def read_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     if not allowed:
         return {"ok": False, "error": error, "path": str(resolved_path)}
 
-    # Check if file exists
-    if not resolved_path.exists():
+    # Check existence, type and size with a single stat call
+    try:
+        st = _safe_stat(resolved_path)
+    except OSError as e:
+        return {"ok": False, "error": f"Cannot stat file: {e}", "path": str(resolved_path)}
+
+    if st is None:
         return {"ok": False, "error": f"File not found: {resolved_path}", "path": str(resolved_path)}
 
-    if not resolved_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         return {"ok": False, "error": f"Path is not a file: {resolved_path}", "path": str(resolved_path)}
 
-    # Check file size
-    try:
-        file_size = resolved_path.stat().st_size
-    except OSError as e:
-        return {"ok": False, "error": f"Cannot stat file: {e}", "path": str(resolved_path)}
+    file_size = st.st_size
 
     if file_size > max_size:
         return {
@@ -300,8 +499,9 @@ def read_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
             "size": file_size,
         }
 
-    # Safety guard: Reject binary files
-    if _is_binary_file(resolved_path):
+    # Safety guard: Reject binary files by extension before touching contents
+    suffix = resolved_path.suffix.lower()
+    if suffix in BINARY_FILE_EXTENSIONS:
         return {
             "ok": False,
             "error": "Binary file detected - cannot read binary files",
@@ -309,16 +509,39 @@ def read_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
             "size": file_size,
         }
 
-    # Read the file
+    # Map the file read-only so the binary check and decoding work directly on
+    # the mapped pages, without an intermediate bytes copy of the whole file
+    mapped = None
+    try:
+        if file_size:
+            fd = os.open(resolved_path, os.O_RDONLY)
+            try:
+                mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+    except (OSError, ValueError) as e:
+        return {"ok": False, "error": f"Read error: {e}", "path": str(resolved_path)}
+
     try:
-        content = resolved_path.read_text(encoding=encoding)
+        # Safety guard: Reject binary files (well-known text extensions skip the scan)
+        if (
+            mapped is not None
+            and suffix not in TEXT_FILE_EXTENSIONS
+            and _looks_binary(mapped[:BINARY_CHECK_BYTES])
+        ):
+            return {
+                "ok": False,
+                "error": "Binary file detected - cannot read binary files",
+                "path": str(resolved_path),
+                "size": file_size,
+            }
 
-        # Optionally limit lines
-        if max_lines and max_lines > 0:
-            lines = content.split("\n")
-            if len(lines) > max_lines:
-                content = "\n".join(lines[:max_lines])
-                content += f"\n... (truncated, showing {max_lines} of {len(lines)} lines)"
+        if mapped is None:
+            content, total_lines = "", 0
+        else:
+            content, total_lines = _decode_mapped_text(mapped, encoding, max_lines)
+        if total_lines:
+            content += f"\n... (truncated, showing {max_lines} of {total_lines} lines)"
 
         return {
             "ok": True,
@@ -328,8 +551,9 @@ def read_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
         }
     except UnicodeDecodeError as e:
         return {"ok": False, "error": f"Encoding error: {e}", "path": str(resolved_path)}
-    except OSError as e:
-        return {"ok": False, "error": f"Read error: {e}", "path": str(resolved_path)}
+    finally:
+        if mapped is not None:
+            mapped.close()
 
 
 def write_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
@@ -389,7 +613,7 @@ def write_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
 
     # Create parent directories if needed
     parent_dir = resolved_path.parent
-    if not parent_dir.exists():
+    if _safe_stat(parent_dir) is None:
         if create_dirs:
             try:
                 parent_dir.mkdir(parents=True, exist_ok=True)
@@ -400,8 +624,10 @@ def write_local_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
 
     # Safety guard: Create backup before overwriting
     backup_path = None
-    if create_backup and resolved_path.exists():
-        backup_path = _create_backup(resolved_path)
+    if create_backup:
+        existing = _safe_stat(resolved_path)
+        if existing is not None and stat.S_ISREG(existing.st_mode):
+            backup_path = _create_backup(resolved_path)
 
     # Write the file
     try:
@@ -426,7 +652,9 @@ def apply_patch_locally(args: Dict[str, Any], tool_context: Any) -> Dict[str, An
     """
     Apply a unified diff patch to the local workspace.
 
-    Uses `git apply` if in a git repository, otherwise falls back to `patch` command.
+    Small plain-text patches are applied in-process. Anything else (file
+    creation/deletion, renames, binary hunks, inexact context) uses `git apply`
+    if in a git repository, otherwise falls back to `patch` command.
 
     Safety guards enforced:
     - Target directory must be within allowed repo roots
@@ -488,14 +716,6 @@ def apply_patch_locally(args: Dict[str, Any], tool_context: Any) -> Dict[str, An
     if not resolved_target.is_dir():
         return {"ok": False, "success": False, "error": f"Target path is not a directory: {resolved_target}", "error_message": f"Target path is not a directory: {resolved_target}", "target_file": str(resolved_target)}
 
-    # Write patch to temporary file
-    try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.patch', delete=False, encoding='utf-8') as patch_file:
-            patch_file.write(patch_content)
-            patch_path = patch_file.name
-    except OSError as e:
-        return {"ok": False, "error": f"Cannot create temporary patch file: {e}", "target_dir": str(resolved_target)}
-
     result = {
         "ok": False,
         "success": False,
@@ -521,11 +741,6 @@ def apply_patch_locally(args: Dict[str, Any], tool_context: Any) -> Dict[str, An
         files_to_patch, resolved_target
     )
     if not is_valid:
-        # Clean up temp file
-        try:
-            os.unlink(patch_path)
-        except OSError:
-            pass
         return {
             "ok": False,
             "success": False,
@@ -538,23 +753,43 @@ def apply_patch_locally(args: Dict[str, Any], tool_context: Any) -> Dict[str, An
     # Create backups of files that will be modified (if not dry_run)
     backup_paths = {}
     if create_backup and not dry_run:
-        for file_path in validated_files:
-            full_path = resolved_target / file_path
-            if full_path.exists():
-                backup = _create_backup(full_path)
-                if backup:
-                    backup_paths[file_path] = backup
+        full_paths = [resolved_target / file_path for file_path in validated_files]
+        if len(full_paths) > 1:
+            backups = list(_IO_POOL.map(_create_backup, full_paths))
+        else:
+            backups = [_create_backup(full_path) for full_path in full_paths]
+        for file_path, backup in zip(validated_files, backups):
+            if backup:
+                backup_paths[file_path] = backup
 
+    patch_path = None
     try:
-        # Check if we're in a git repository
-        is_git_repo = (resolved_target / ".git").exists() or _is_inside_git_repo(resolved_target)
+        # Small plain-text patches are applied in-process, avoiding a fork+exec of
+        # git/patch; anything the simple applier can't apply exactly falls through
+        apply_result = None
+        if len(patch_content) <= INPROCESS_PATCH_MAX_SIZE:
+            apply_result = _apply_in_process(
+                patch_content, resolved_target, dry_run, strip, validated_files
+            )
 
-        if is_git_repo:
-            # Use git apply
-            apply_result = _apply_with_git(patch_path, resolved_target, dry_run, strip)
-        else:
-            # Use patch command
-            apply_result = _apply_with_patch(patch_path, resolved_target, dry_run, strip)
+        if apply_result is None:
+            # Write patch to temporary file
+            try:
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.patch', delete=False, encoding='utf-8') as patch_file:
+                    patch_file.write(patch_content)
+                    patch_path = patch_file.name
+            except OSError as e:
+                return {"ok": False, "error": f"Cannot create temporary patch file: {e}", "target_dir": str(resolved_target)}
+
+            # Check if we're in a git repository
+            is_git_repo = (resolved_target / ".git").exists() or _is_inside_git_repo(resolved_target)
+
+            if is_git_repo:
+                # Use git apply
+                apply_result = _apply_with_git(patch_path, resolved_target, dry_run, strip)
+            else:
+                # Use patch command
+                apply_result = _apply_with_patch(patch_path, resolved_target, dry_run, strip)
 
         # Merge apply_result into result
         result.update(apply_result)
@@ -568,17 +803,20 @@ def apply_patch_locally(args: Dict[str, Any], tool_context: Any) -> Dict[str, An
 
         # Generate diff preview for successful patches
         if result["success"] and not dry_run and result.get("files_modified"):
-            diff_preview = _generate_diff_preview(resolved_target, result["files_modified"][:1])
+            diff_preview = _generate_diff_preview(
+                resolved_target, result["files_modified"][:1], backup_paths=backup_paths
+            )
             result["diff_preview"] = diff_preview
 
         return result
 
     finally:
         # Clean up temporary file
-        try:
-            os.unlink(patch_path)
-        except OSError:
-            pass
+        if patch_path:
+            try:
+                os.unlink(patch_path)
+            except OSError:
+                pass
 
 
 def _is_inside_git_repo(path: Path) -> bool:
@@ -600,7 +838,6 @@ def _extract_files_from_patch(patch_content: str) -> List[str]:
     Returns:
         List of file paths that will be modified by the patch
     """
-    import re
     files = []
 
     # Match "--- a/path/to/file" or "+++ b/path/to/file" patterns
@@ -631,8 +868,7 @@ def _validate_patch_file_paths(
     Returns:
         Tuple of (is_valid, error_message, validated_files)
     """
-    validated_files = []
-
+    # Cheap string checks first, so no syscalls are spent on a rejected patch
     for file_path in files:
         # FIX 5: Reject absolute paths in patch content
         if file_path.startswith("/"):
@@ -650,13 +886,28 @@ def _validate_patch_file_paths(
                 [],
             )
 
-        # FIX 5: Resolve full path and verify it's within allowed roots
-        full_path = (target_dir / file_path).resolve()
+    # Invariants hoisted out of the per-file loop
+    target_str = str(target_dir)
+    target_prefix = target_str.rstrip(os.sep) + os.sep
+    roots_key = _allowed_roots_key()
+    resolved_parents: Dict[str, str] = {}
+
+    validated_files = []
+    for file_path in files:
+        # FIX 5: Resolve full path and verify it's within allowed roots. With ".."
+        # rejected above, joining is pure string work; symlinks are resolved once
+        # per unique parent directory, plus the leaf only if it is itself a link.
+        joined = os.path.normpath(os.path.join(target_str, file_path))
+        parent, name = os.path.split(joined)
+        resolved_parent = resolved_parents.get(parent)
+        if resolved_parent is None:
+            resolved_parent = resolved_parents[parent] = os.path.realpath(parent)
+        full_path = os.path.join(resolved_parent, name)
+        if os.path.islink(full_path):
+            full_path = os.path.realpath(full_path)
 
         # Check that resolved path is still under target_dir (handles symlink attacks)
-        try:
-            full_path.relative_to(target_dir)
-        except ValueError:
+        if full_path != target_str and not full_path.startswith(target_prefix):
             return (
                 False,
                 f"Path escapes target directory after resolution: {file_path}",
@@ -664,7 +915,7 @@ def _validate_patch_file_paths(
             )
 
         # Check against allowed repo roots
-        allowed, error = _check_in_allowed_roots(full_path)
+        allowed, error = _check_in_allowed_roots(Path(full_path), roots_key)
         if not allowed:
             return (False, f"Patch file path {file_path}: {error}", [])
 
@@ -673,13 +924,22 @@ def _validate_patch_file_paths(
     return (True, "", validated_files)
 
 
-def _generate_diff_preview(target_dir: Path, files: List[str], max_chars: int = 500) -> Optional[str]:
+def _generate_diff_preview(
+    target_dir: Path,
+    files: List[str],
+    max_chars: int = 500,
+    backup_paths: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
     """Generate a preview of the diff after patch application.
 
+    When a pre-patch backup of the first file exists, the preview is diffed
+    in-process against it; otherwise falls back to `git diff HEAD`.
+
     Args:
         target_dir: Directory where patch was applied
         files: List of modified files
         max_chars: Maximum characters for preview
+        backup_paths: Mapping of patched file path to its backup path
 
     Returns:
         Diff preview string or None if unavailable
@@ -687,6 +947,13 @@ def _generate_diff_preview(target_dir: Path, files: List[str], max_chars: int =
     if not files:
         return None
 
+    backup = (backup_paths or {}).get(files[0])
+    if backup:
+        try:
+            return _backup_diff_preview(Path(backup), target_dir / files[0], files[0], max_chars)
+        except OSError:
+            pass  # Fall back to git diff
+
     try:
         # Try to get git diff for the first file
         result = subprocess.run(
@@ -709,6 +976,245 @@ def _generate_diff_preview(target_dir: Path, files: List[str], max_chars: int =
     return None
 
 
+def _backup_diff_preview(
+    backup: Path, current: Path, name: str, max_chars: int
+) -> Optional[str]:
+    """Diff a file against its pre-patch backup in-process, up to `max_chars`."""
+    old = backup.read_text(errors="replace").splitlines()
+    new = current.read_text(errors="replace").splitlines()
+
+    # Stop generating diff lines once the preview budget is exceeded
+    lines = []
+    size = 0
+    for line in difflib.unified_diff(old, new, f"a/{name}", f"b/{name}", lineterm=""):
+        if size > max_chars:
+            break
+        lines.append(line)
+        size += len(line) + 1
+    if not lines:
+        return None
+
+    preview = ("\n".join(lines) + "\n")[:max_chars]
+    if size > max_chars:
+        preview += "\n... (truncated)"
+    return preview
+
+
+def _strip_patch_path(header_path: str, strip: int) -> Optional[str]:
+    """Strip leading components from a ---/+++ header path, as `-p<strip>` does."""
+    path = header_path.split("\t")[0].strip()
+    if path == "/dev/null":
+        return None
+    parts = path.split("/")
+    if len(parts) <= strip:
+        return None
+    return "/".join(parts[strip:])
+
+
+def _parse_simple_patch(
+    patch_content: str, strip: int
+) -> Optional[List[tuple[str, List[tuple[int, int, List[str], List[str]]]]]]:
+    """Parse a plain unified diff into per-file hunks.
+
+    Args:
+        patch_content: The patch content to parse
+        strip: Number of leading path components to strip
+
+    Returns:
+        List of (path, hunks) where each hunk is (old_start, old_len, old_lines,
+        new_lines), or None if the patch uses anything beyond in-place text edits
+    """
+    lines = patch_content.split("\n")
+    files: List[tuple[str, List[tuple[int, int, List[str], List[str]]]]] = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if line.startswith(_UNSUPPORTED_PATCH_HEADERS):
+            return None
+
+        if line.startswith("--- "):
+            if i + 1 >= len(lines) or not lines[i + 1].startswith("+++ "):
+                return None
+            old_path = _strip_patch_path(line[4:], strip)
+            new_path = _strip_patch_path(lines[i + 1][4:], strip)
+            if old_path is None or old_path != new_path:
+                return None
+            files.append((new_path, []))
+            i += 2
+            continue
+
+        if line.startswith("@@"):
+            match = _HUNK_HEADER_RE.match(line)
+            if not match or not files:
+                return None
+            old_start = int(match.group(1))
+            old_len = int(match.group(2) or 1)
+            new_len = int(match.group(4) or 1)
+
+            old_lines: List[str] = []
+            new_lines: List[str] = []
+            i += 1
+            while len(old_lines) < old_len or len(new_lines) < new_len:
+                if i >= len(lines):
+                    return None
+                body = lines[i]
+                tag, text = body[:1], body[1:]
+                if tag == " ":
+                    old_lines.append(text)
+                    new_lines.append(text)
+                elif tag == "-":
+                    old_lines.append(text)
+                elif tag == "+":
+                    new_lines.append(text)
+                else:
+                    return None
+                i += 1
+
+            if len(old_lines) != old_len or len(new_lines) != new_len:
+                return None
+            # "\ No newline at end of file" needs byte-exact EOF handling
+            if i < len(lines) and lines[i].startswith("\\"):
+                return None
+
+            files[-1][1].append((old_start, old_len, old_lines, new_lines))
+            continue
+
+        i += 1
+
+    if not files or any(not hunks for _, hunks in files):
+        return None
+    return files
+
+
+def _apply_in_process(
+    patch_content: str,
+    target_dir: Path,
+    dry_run: bool,
+    strip: int,
+    allowed_files: List[str],
+) -> Optional[Dict[str, Any]]:
+    """Apply a plain unified diff without spawning git/patch.
+
+    Every hunk must match its context exactly at the stated position, and all
+    files are patched in memory before anything is written. Repeated sections
+    for one file apply in order to the already patched text.
+
+    Args:
+        patch_content: Unified diff content
+        target_dir: Directory to apply the patch in
+        dry_run: Only check that the patch applies
+        strip: Number of leading path components to strip
+        allowed_files: Validated file paths the patch may touch
+
+    Returns:
+        Result dict in the same shape as `_apply_with_git`, or None if the patch
+        must be handled by the external tools
+    """
+    parsed = _parse_simple_patch(patch_content, strip)
+    if parsed is None:
+        return None
+
+    allowed = set(allowed_files)
+    # rel path -> patched text, in first-seen order
+    patched: Dict[str, str] = {}
+    hunks_applied = 0
+    for rel_path, hunks in parsed:
+        if rel_path not in allowed:
+            return None
+        text = patched.get(rel_path)
+        if text is None:
+            try:
+                text = (target_dir / rel_path).read_bytes().decode("utf-8")
+            except (OSError, UnicodeDecodeError):
+                return None
+            # Files without a trailing newline need "\ No newline" handling
+            if text and not text.endswith("\n"):
+                return None
+        original = text[:-1].split("\n") if text else []
+
+        out: List[str] = []
+        pos = 0
+        for old_start, old_len, old_lines, new_lines in hunks:
+            # A zero-length old range means "insert after line old_start"
+            start = old_start - 1 if old_len else old_start
+            if start < pos or original[start:start + old_len] != old_lines:
+                return None
+            out.extend(original[pos:start])
+            out.extend(new_lines)
+            pos = start + old_len
+        out.extend(original[pos:])
+
+        patched[rel_path] = "\n".join(out) + "\n" if out else ""
+        hunks_applied += len(hunks)
+
+    if not dry_run:
+        try:
+            _replace_files(
+                {target_dir / rel_path: new_text.encode("utf-8") for rel_path, new_text in patched.items()}
+            )
+        except OSError as e:
+            return {
+                "ok": False,
+                "files_modified": [],
+                "files_created": [],
+                "files_deleted": [],
+                "message": "Patch application failed",
+                "conflicts": [],
+                "error": f"Cannot write patched file: {e}",
+            }
+
+    message = "Patch applied successfully" if not dry_run else "Dry run: patch can be applied"
+    return {
+        "ok": True,
+        "files_modified": list(patched),
+        "files_created": [],
+        "files_deleted": [],
+        "hunks_applied": hunks_applied,
+        "message": message,
+        "conflicts": [],
+    }
+
+
+def _replace_files(contents: Dict[Path, bytes]) -> None:
+    """Replace several files, staging all new contents before touching any.
+
+    Each file is written to a temp file beside it (keeping its mode) and only
+    once every temp file exists are they moved into place with `os.replace`,
+    so a failed write leaves all targets unmodified. Symlinked targets are
+    written through to the file they point at.
+
+    Raises:
+        OSError: If a file can't be staged or replaced
+    """
+    staged: List[tuple[str, str]] = []
+    try:
+        for path, data in contents.items():
+            real_path = os.path.realpath(path)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(real_path), prefix=f".{path.name}.", suffix=".tmp"
+            )
+            staged.append((tmp_path, real_path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            shutil.copymode(real_path, tmp_path)
+        while staged:
+            tmp_path, real_path = staged[0]
+            os.replace(tmp_path, real_path)
+            staged.pop(0)
+    finally:
+        for tmp_path, _ in staged:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured subprocess output for inclusion in results."""
+    return data.decode("utf-8", "replace")
+
+
 def _apply_with_git(patch_path: str, target_dir: Path, dry_run: bool, strip: int) -> Dict[str, Any]:
     """Apply patch using git apply command."""
     cmd = ["git", "apply", f"-p{strip}"]
@@ -725,23 +1231,18 @@ def _apply_with_git(patch_path: str, target_dir: Path, dry_run: bool, strip: int
             cmd,
             cwd=str(target_dir),
             capture_output=True,
-            text=True,
             timeout=60,
         )
 
         if result.returncode == 0:
             # Parse output for modified files
-            files_modified = []
+            # Extract filename from "Applied patch path/to/file cleanly."
+            files_modified = [
+                _decode_output(m.group(1)) for m in _GIT_APPLIED_RE.finditer(result.stderr)
+            ]
             files_created = []
             files_deleted = []
 
-            for line in result.stderr.split('\n'):
-                if line.startswith('Applied patch '):
-                    # Extract filename from "Applied patch path/to/file cleanly."
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        files_modified.append(parts[2])
-
             message = "Patch applied successfully" if not dry_run else "Dry run: patch can be applied"
             return {
                 "ok": True,
@@ -753,13 +1254,13 @@ def _apply_with_git(patch_path: str, target_dir: Path, dry_run: bool, strip: int
             }
         else:
             # Parse error output for conflicts
-            conflicts = []
-            error_lines = []
-            for line in result.stderr.split('\n'):
-                if 'error:' in line.lower() or 'conflict' in line.lower():
-                    conflicts.append(line.strip())
-                if line.strip():
-                    error_lines.append(line.strip())
+            conflicts = [
+                _decode_output(m.group(0)).strip()
+                for m in _GIT_CONFLICT_RE.finditer(result.stderr)
+            ]
+            error_lines = [
+                line.strip() for line in _decode_output(result.stderr).split('\n') if line.strip()
+            ]
 
             return {
                 "ok": False,
@@ -805,20 +1306,15 @@ def _apply_with_patch(patch_path: str, target_dir: Path, dry_run: bool, strip: i
             cmd,
             cwd=str(target_dir),
             capture_output=True,
-            text=True,
             timeout=60,
         )
 
         if result.returncode == 0:
             # Parse output for modified files
-            files_modified = []
-
-            for line in result.stdout.split('\n'):
-                if 'patching file' in line.lower():
-                    # Extract filename from "patching file path/to/file"
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        files_modified.append(parts[2])
+            # Extract filename from "patching file path/to/file"
+            files_modified = [
+                _decode_output(m.group(1)) for m in _PATCHING_FILE_RE.finditer(result.stdout)
+            ]
 
             message = "Patch applied successfully" if not dry_run else "Dry run: patch can be applied"
             return {
@@ -831,10 +1327,10 @@ def _apply_with_patch(patch_path: str, target_dir: Path, dry_run: bool, strip: i
             }
         else:
             # Parse output for conflicts/rejections
-            conflicts = []
-            for line in (result.stdout + result.stderr).split('\n'):
-                if 'reject' in line.lower() or 'failed' in line.lower() or 'hunk' in line.lower():
-                    conflicts.append(line.strip())
+            conflicts = [
+                _decode_output(m.group(0)).strip()
+                for m in _PATCH_CONFLICT_RE.finditer(result.stdout + b"\n" + result.stderr)
+            ]
 
             return {
                 "ok": False,
@@ -843,7 +1339,7 @@ def _apply_with_patch(patch_path: str, target_dir: Path, dry_run: bool, strip: i
                 "files_deleted": [],
                 "message": "Patch application failed",
                 "conflicts": conflicts,
-                "error": result.stderr or result.stdout or "patch command failed",
+                "error": _decode_output(result.stderr or result.stdout) or "patch command failed",
             }
 
     except subprocess.TimeoutExpired:
@@ -878,12 +1374,14 @@ def list_directory(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
             - recursive: Optional[bool] - List recursively (default: False)
             - pattern: Optional[str] - Glob pattern to filter entries (e.g., "*.py")
             - max_depth: Optional[int] - Maximum recursion depth (default: 20)
+            - count_only: Optional[bool] - Only count entries, don't return them (default: False)
         tool_context: ADK tool context (unused but required for signature)
 
     Returns:
         Dictionary containing:
             - ok: bool - Success status
             - entries: List[Dict] - List of files/dirs with path, name, type, size
+              (omitted when count_only is set)
             - count: int - Number of entries
             - truncated: bool - Whether results were truncated
             - error: str - Error message (on failure)
@@ -892,6 +1390,7 @@ def list_directory(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     recursive = args.get("recursive", False)
     pattern = args.get("pattern")
     max_depth = args.get("max_depth")
+    count_only = bool(args.get("count_only", False))
 
     if not path:
         return {"ok": False, "error": "path is required", "path": ""}
@@ -915,108 +1414,296 @@ def list_directory(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     truncated = False
 
     try:
+        matcher = _compile_pattern(pattern)
+        if count_only and not recursive:
+            # Pure count: no entry dicts and no per-entry stat calls
+            with os.scandir(resolved_path) as it:
+                count = sum(1 for entry in it if not matcher or matcher(entry.name))
+            return {"ok": True, "count": count, "truncated": False, "path": str(resolved_path)}
+
         if recursive:
-            entries, truncated = _list_recursive(resolved_path, pattern, effective_max_depth, 0)
+            entries, truncated = _list_recursive(str(resolved_path), matcher, effective_max_depth, 0)
         else:
-            entries, truncated = _list_single_level(resolved_path, pattern)
+            entries, truncated = _list_single_level(str(resolved_path), matcher)
 
-        return {
+        result = {
             "ok": True,
             "entries": entries,
             "count": len(entries),
             "truncated": truncated,
             "path": str(resolved_path),
         }
+        if count_only:
+            del result["entries"]
+        return result
 
     except OSError as e:
         return {"ok": False, "error": f"Directory listing error: {e}", "path": str(resolved_path)}
 
 
-def _list_single_level(dir_path: Path, pattern: Optional[str]) -> tuple[List[Dict[str, Any]], bool]:
-    """List entries in a single directory level."""
-    entries = []
+def _compile_pattern(pattern: Optional[str]) -> Optional[Callable[[str], bool]]:
+    """Build a name filter equivalent to `fnmatch.fnmatch(name, pattern)`.
+
+    The matcher is built once per listing instead of going through fnmatch's
+    cache on every entry; see `glob_matcher`.
+    """
+    if not pattern:
+        return None
+    return glob_matcher(pattern)
+
+
+def _list_single_level(
+    dir_path: str, matcher: Optional[Callable[[str], bool]]
+) -> tuple[List[Dict[str, Any]], bool]:
+    """List entries in a single directory level.
+
+    Where the platform allows, the directory is opened once and scanned
+    through its descriptor, so each entry's lstat is an fstatat() relative
+    to that fd rather than a lookup of the full path.
+    """
+    selected = []
     truncated = False
 
-    for entry in dir_path.iterdir():
-        if len(entries) >= MAX_DIRECTORY_ENTRIES:
-            truncated = True
-            break
+    dir_fd = None
+    if os.scandir in os.supports_fd:
+        dir_fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        with os.scandir(dir_path if dir_fd is None else dir_fd) as it:
+            for entry in it:
+                if len(selected) >= MAX_DIRECTORY_ENTRIES:
+                    truncated = True
+                    break
+
+                # Apply pattern filter
+                if matcher and not matcher(entry.name):
+                    continue
+                selected.append(entry)
+
+        # Entries from an fd scan only carry their name; stats need the fd open
+        _prefetch_stats(selected)
+        parent = None if dir_fd is None else dir_path
+        entries = []
+        for entry in selected:
+            entry_info = _get_entry_info(entry, parent)
+            if entry_info:
+                entries.append(entry_info)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return entries, truncated
 
-        # Apply pattern filter
-        if pattern and not fnmatch.fnmatch(entry.name, pattern):
+
+def _stat_batch(entries: List[os.DirEntry]) -> None:
+    for entry in entries:
+        try:
+            entry.stat(follow_symlinks=False)
+        except OSError:
+            pass  # Reported again (and skipped) by _get_entry_info
+
+
+def _prefetch_stats(entries: List[os.DirEntry]) -> None:
+    """Warm the cached stat of a large batch of scandir entries concurrently.
+
+    Only regular files are stat'ed, as nothing else reports a size. Batches of
+    STAT_BATCH_SIZE run on the shared I/O pool so stat latency on slow or cold
+    filesystems overlaps; small directories are left to the serial path. Must
+    not be called from a pool worker.
+    """
+    pending = []
+    for entry in entries:
+        try:
+            if entry.is_file(follow_symlinks=False):
+                pending.append(entry)
+        except OSError:
             continue
+    if len(pending) < PARALLEL_STAT_MIN_ENTRIES:
+        return
+    batches = [pending[i : i + STAT_BATCH_SIZE] for i in range(0, len(pending), STAT_BATCH_SIZE)]
+    for _ in _IO_POOL.map(_stat_batch, batches):
+        pass
 
-        entry_info = _get_entry_info(entry)
-        if entry_info:
-            entries.append(entry_info)
 
-    return entries, truncated
+class _EntryBudget:
+    """Thread-safe cap on the number of entries a single listing may collect."""
+
+    def __init__(self, limit: int):
+        self._remaining = limit
+        self._lock = threading.Lock()
+        self.exhausted = threading.Event()
+
+    def take(self) -> bool:
+        """Reserve room for one entry; returns False once the cap is reached."""
+        with self._lock:
+            if self._remaining <= 0:
+                self.exhausted.set()
+                return False
+            self._remaining -= 1
+            return True
 
 
 def _list_recursive(
-    dir_path: Path,
-    pattern: Optional[str],
+    dir_path: str,
+    matcher: Optional[Callable[[str], bool]],
     max_depth: int,
-    current_depth: int
+    current_depth: int,
+    budget: Optional[_EntryBudget] = None,
+    fan_out: bool = True,
 ) -> tuple[List[Dict[str, Any]], bool]:
-    """Recursively list directory entries."""
+    """Recursively list directory entries.
+
+    Walks the tree with an explicit stack rather than one call per directory;
+    entries come out in pre-order (each directory followed by its subtree).
+    Symlinked directories are listed but not descended into. Paths stay plain
+    strings (scandir's own) throughout; no Path objects are built per entry.
+    When a directory has more than PARALLEL_LISTING_MIN_FANOUT subdirectories,
+    their subtrees are listed concurrently on the shared I/O pool so directory
+    read latency overlaps. Pool workers walk their subtree serially (fan_out is
+    False), so only the calling thread ever waits on the pool.
+    """
+    if budget is None:
+        budget = _EntryBudget(MAX_DIRECTORY_ENTRIES)
     entries = []
-    truncated = False
 
-    if current_depth > max_depth:
-        return entries, False
+    if current_depth > max_depth or budget.exhausted.is_set():
+        return entries, budget.exhausted.is_set()
 
+    # Items are (entry, depth, future); future holds a subtree listed on the pool
+    stack = []
+    futures = []
+    scan: Optional[tuple[str, int]] = (dir_path, current_depth)
     try:
-        for entry in dir_path.iterdir():
-            if len(entries) >= MAX_DIRECTORY_ENTRIES:
-                truncated = True
+        while True:
+            if scan is not None:
+                scan_path, depth = scan
+                scan = None
+                try:
+                    with os.scandir(scan_path) as it:
+                        children = list(it)
+                except PermissionError:
+                    children = []  # Skip directories we can't access
+
+                if fan_out and not budget.exhausted.is_set():
+                    _prefetch_stats([entry for entry in children if not matcher or matcher(entry.name)])
+
+                pending = {}
+                if fan_out and depth < max_depth:
+                    subdirs = [entry for entry in children if entry.is_dir(follow_symlinks=False)]
+                    if len(subdirs) > PARALLEL_LISTING_MIN_FANOUT:
+                        pending = {
+                            sub: _IO_POOL.submit(
+                                _list_recursive, sub.path, matcher, max_depth, depth + 1, budget, False
+                            )
+                            for sub in subdirs
+                        }
+                        futures.extend(pending.values())
+                stack.extend((entry, depth, pending.get(entry)) for entry in reversed(children))
+
+            if not stack:
                 break
+            entry, depth, future = stack.pop()
+
+            # Once the cap is hit, skip new work but still merge subtrees that
+            # already reserved entries
+            exhausted = budget.exhausted.is_set()
+
+            # Apply pattern filter (still descend into directories that don't match)
+            if not exhausted and (not matcher or matcher(entry.name)):
+                entry_info = _get_entry_info(entry)
+                if entry_info and budget.take():
+                    entries.append(entry_info)
+
+            if future is not None:
+                entries.extend(future.result()[0])
+            elif not exhausted and depth < max_depth and entry.is_dir(follow_symlinks=False):
+                scan = (entry.path, depth + 1)
+    finally:
+        for future in futures:
+            future.cancel()
 
-            # Apply pattern filter
-            if pattern and not fnmatch.fnmatch(entry.name, pattern):
-                # Still recurse into directories even if they don't match pattern
-                if entry.is_dir():
-                    sub_entries, sub_truncated = _list_recursive(
-                        entry, pattern, max_depth, current_depth + 1
-                    )
-                    entries.extend(sub_entries)
-                    if sub_truncated:
-                        truncated = True
-                continue
-
-            entry_info = _get_entry_info(entry)
-            if entry_info:
-                entries.append(entry_info)
-
-            # Recurse into directories
-            if entry.is_dir():
-                sub_entries, sub_truncated = _list_recursive(
-                    entry, pattern, max_depth, current_depth + 1
-                )
-                entries.extend(sub_entries)
-                if sub_truncated:
-                    truncated = True
-
-    except PermissionError:
-        pass  # Skip directories we can't access
+    return entries, budget.exhausted.is_set()
 
-    return entries, truncated
 
+def _get_entry_info(entry: os.DirEntry, parent: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Get information about a directory entry.
 
-def _get_entry_info(entry: Path) -> Optional[Dict[str, Any]]:
-    """Get information about a directory entry."""
+    Type comes from the scandir entry's cached d_type without following
+    symlinks, so links are reported as "symlink" rather than resolved. Only
+    regular files are stat'ed (lstat, cached on the entry) for their size.
+    `parent` is the directory path for entries from an fd-based scandir,
+    whose own `path` is just the name.
+    """
     try:
-        stat_info = entry.stat()
+        size = 0
+        if entry.is_dir(follow_symlinks=False):
+            path_type = "directory"
+        elif entry.is_symlink():
+            path_type = "symlink"
+        else:
+            path_type = "file"
+            if entry.is_file(follow_symlinks=False):
+                size = entry.stat(follow_symlinks=False).st_size
         return {
-            "path": str(entry),
+            "path": entry.path if parent is None else os.path.join(parent, entry.name),
             "name": entry.name,
-            "type": "directory" if entry.is_dir() else "file",
-            "size": stat_info.st_size if entry.is_file() else 0,
+            "type": path_type,
+            "size": size,
         }
     except OSError:
         return None
 
 
+def _access_flags(path: Path, stat_info: os.stat_result) -> tuple[bool, bool, bool]:
+    """Determine whether the current process can read, write and execute a path.
+
+    The answer is predicted from the mode bits already in `stat_info`. Bits
+    predicted granted are confirmed with a single `os.access` call for the
+    combined mask (falling back to separate probes when the kernel disagrees,
+    e.g. read-only mounts). Bits predicted denied are always probed, since
+    ACLs or capabilities can grant access the mode bits don't show.
+
+    Returns:
+        Tuple of (readable, writable, executable)
+    """
+    if not hasattr(os, "geteuid"):
+        return (
+            os.access(path, os.R_OK),
+            os.access(path, os.W_OK),
+            os.access(path, os.X_OK),
+        )
+
+    mode = stat_info.st_mode
+    euid = os.geteuid()
+    if euid == 0:
+        # root bypasses r/w bits; execute needs some x bit (or a directory)
+        predicted = (True, True, bool(mode & 0o111) or stat.S_ISDIR(mode))
+    else:
+        if stat_info.st_uid == euid:
+            bits = mode >> 6
+        elif stat_info.st_gid == os.getegid() or stat_info.st_gid in os.getgroups():
+            bits = mode >> 3
+        else:
+            bits = mode
+        predicted = (bool(bits & 4), bool(bits & 2), bool(bits & 1))
+
+    flags = (os.R_OK, os.W_OK, os.X_OK)
+    mask = 0
+    for granted, flag in zip(predicted, flags):
+        if granted:
+            mask |= flag
+    if mask and not os.access(path, mask):
+        return (
+            os.access(path, os.R_OK),
+            os.access(path, os.W_OK),
+            os.access(path, os.X_OK),
+        )
+
+    readable, writable, executable = (
+        granted or os.access(path, flag) for granted, flag in zip(predicted, flags)
+    )
+    return readable, writable, executable
+
+
 def get_file_info(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     """
     Get information about a file or directory.
@@ -1078,9 +1765,7 @@ def get_file_info(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
             created = datetime.fromtimestamp(stat_info.st_ctime).isoformat()
 
         # Check permissions
-        readable = os.access(resolved_path, os.R_OK)
-        writable = os.access(resolved_path, os.W_OK)
-        executable = os.access(resolved_path, os.X_OK)
+        readable, writable, executable = _access_flags(resolved_path, stat_info)
 
         return {
             "ok": True,
@@ -1131,8 +1816,16 @@ def create_directory(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     if not valid:
         return {"ok": False, "error": error, "path": path}
 
-    # Check if already exists
-    if resolved_path.exists():
+    # Attempt the mkdir first; only look at what's there if it already exists
+    try:
+        resolved_path.mkdir(parents=parents, exist_ok=False)
+        return {
+            "ok": True,
+            "path": str(resolved_path),
+            "message": f"Successfully created directory: {resolved_path}",
+            "created": True,
+        }
+    except FileExistsError as e:
         if resolved_path.is_dir():
             if exist_ok:
                 return {
@@ -1141,28 +1834,19 @@ def create_directory(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
                     "message": f"Directory already exists: {resolved_path}",
                     "created": False,
                 }
-            else:
-                return {
-                    "ok": False,
-                    "error": f"Directory already exists: {resolved_path}",
-                    "path": str(resolved_path),
-                }
-        else:
+            return {
+                "ok": False,
+                "error": f"Directory already exists: {resolved_path}",
+                "path": str(resolved_path),
+            }
+        if os.path.lexists(resolved_path):
             return {
                 "ok": False,
                 "error": f"Path exists but is not a directory: {resolved_path}",
                 "path": str(resolved_path),
             }
-
-    # Create the directory
-    try:
-        resolved_path.mkdir(parents=parents, exist_ok=exist_ok)
-        return {
-            "ok": True,
-            "path": str(resolved_path),
-            "message": f"Successfully created directory: {resolved_path}",
-            "created": True,
-        }
+        # A parent component exists but is not a directory
+        return {"ok": False, "error": f"Cannot create directory: {e}", "path": str(resolved_path)}
     except OSError as e:
         return {"ok": False, "error": f"Cannot create directory: {e}", "path": str(resolved_path)}
 
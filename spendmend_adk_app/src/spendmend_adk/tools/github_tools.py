@@ -2,17 +2,60 @@
 
 from __future__ import annotations
 
-import fnmatch
+import atexit
 import os
 import re
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import urlparse
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # C JSON parser for large API payloads; stdlib json otherwise
+except ImportError:
+    orjson = None
+
+try:
+    import pygit2  # libgit2 bindings: clone/checkout in-process instead of spawning git
+except ImportError:
+    pygit2 = None
 
 from spendmend_adk.settings import settings
+from spendmend_adk.tools._glob import glob_matcher
+
+GITHUB_PER_PAGE = 100
+ETAG_CACHE_MAX_ENTRIES = 1024
+
+_BASE_HEADERS: Dict[str, str] = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+if settings.github_token:
+    _BASE_HEADERS["Authorization"] = f"Bearer {settings.github_token}"
+
+_PR_RE_HTML = re.compile(r"^/([^/]+)/([^/]+)/pull/([0-9]+)$")
+_PR_RE_API = re.compile(r"^/repos/([^/]+)/([^/]+)/pulls/([0-9]+)$")
+
+# One keep-alive connection pool shared by every GitHub API call, so pages and
+# follow-up requests reuse the TLS connection instead of handshaking each time.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Worker threads for overlapping independent GitHub requests (e.g. list pages)
+_HTTP_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="github-http")
+atexit.register(_HTTP_POOL.shutdown, wait=False)
+
+# (url, encoded params, Accept) -> (ETag, parsed body, Link relations), least
+# recently used first. Only the decoded payload is kept, not the Response.
+_ETAG_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[str, Any, Dict[str, Dict[str, str]]]]" = OrderedDict()
+_ETAG_LOCK = threading.Lock()
 
 
 def _run_git(args: List[str], *, cwd: Optional[str] = None) -> str:
@@ -45,25 +88,100 @@ def _parse_pr_url(pr_url: str) -> Tuple[str, str, int]:
     """
     u = urlparse(pr_url)
     path = u.path.rstrip("/")
-    m = re.match(r"^/([^/]+)/([^/]+)/pull/([0-9]+)$", path)
+    m = _PR_RE_HTML.match(path)
     if m:
         return m.group(1), m.group(2), int(m.group(3))
-    m = re.match(r"^/repos/([^/]+)/([^/]+)/pulls/([0-9]+)$", path)
+    m = _PR_RE_API.match(path)
     if m:
         return m.group(1), m.group(2), int(m.group(3))
     raise ValueError(f"Unrecognized PR URL: {pr_url}")
 
 
 def _gh_headers(extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    if settings.github_token:
-        headers["Authorization"] = f"Bearer {settings.github_token}"
+    """Request headers for the GitHub API.
+
+    Without `extra` the shared module-level dict is returned; callers must
+    not mutate it.
+    """
     if extra:
-        headers.update(extra)
-    return headers
+        return {**_BASE_HEADERS, **extra}
+    return _BASE_HEADERS
+
+
+def _load_json(resp: requests.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _get_cached(
+    url: str,
+    headers: Dict[str, str],
+    params: Optional[Dict[str, Any]] = None,
+    *,
+    as_text: bool = False,
+) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+    """GET a GitHub API resource, revalidating earlier responses by ETag.
+
+    Returns the parsed JSON body (or the text with `as_text`) and the Link
+    header relations; raises `requests.HTTPError` for error statuses. GitHub
+    answers a matching If-None-Match with an empty 304 that does not count
+    against the rate limit; the stored body is returned instead. The Link
+    relations are stored too since a 304 needn't repeat them. Returned bodies
+    may be shared with the cache and must not be mutated.
+    """
+    key = (url, urlencode(sorted((params or {}).items())), headers.get("Accept", ""))
+    with _ETAG_LOCK:
+        cached = _ETAG_CACHE.get(key)
+        if cached:
+            _ETAG_CACHE.move_to_end(key)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
+
+    resp = _SESSION.get(url, headers=headers, params=params, timeout=60)
+    if resp.status_code == 304 and cached:
+        return cached[1], cached[2]
+    resp.raise_for_status()
+
+    body = resp.text if as_text else _load_json(resp)
+    links = resp.links
+    etag = resp.headers.get("ETag")
+    if etag:
+        with _ETAG_LOCK:
+            _ETAG_CACHE[key] = (etag, body, links)
+            _ETAG_CACHE.move_to_end(key)
+            while len(_ETAG_CACHE) > ETAG_CACHE_MAX_ENTRIES:
+                _ETAG_CACHE.popitem(last=False)
+    return body, links
+
+
+def _get_page(url: str, page: int) -> Tuple[List[Any], Dict[str, Dict[str, str]]]:
+    return _get_cached(url, _gh_headers(), {"per_page": GITHUB_PER_PAGE, "page": page})
+
+
+def _paginate(url: str) -> List[Any]:
+    """Fetch every item of a paginated GitHub list endpoint.
+
+    The first response's Link header names the last page, so the remaining
+    pages are requested concurrently; items keep page order. Without a
+    rel="last" link, pages are followed one at a time until a short page.
+    """
+    batch, links = _get_page(url, 1)
+    items = list(batch)
+
+    last_url = links.get("last", {}).get("url")
+    if last_url:
+        last_page = int(parse_qs(urlparse(last_url).query).get("page", ["1"])[0])
+        for page_items, _ in _HTTP_POOL.map(partial(_get_page, url), range(2, last_page + 1)):
+            items.extend(page_items)
+        return items
+
+    page = 1
+    while len(batch) >= GITHUB_PER_PAGE:
+        page += 1
+        batch, _ = _get_page(url, page)
+        items.extend(batch)
+    return items
 
 
 def gh_clone_at_ref(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
@@ -94,21 +212,10 @@ def gh_clone_at_ref(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
         if target_path.exists() and any(target_path.iterdir()):
             raise ValueError(f"target_dir is not empty: {target_dir}")
 
-        clone_url = _with_github_token_in_url(clone_url)
-        clone_cmd = ["clone"]
-        if depth:
-            clone_cmd += ["--depth", str(int(depth))]
-        clone_cmd += [clone_url, target_dir]
-        _run_git(clone_cmd)
-
-        try:
-            _run_git(["-C", target_dir, "checkout", ref])
-        except Exception:
-            # Fetch the ref explicitly then retry.
-            _run_git(["-C", target_dir, "fetch", "--all", "--tags"])
-            _run_git(["-C", target_dir, "checkout", ref])
-
-        commit_sha = _run_git(["-C", target_dir, "rev-parse", "HEAD"])
+        if pygit2 is not None:
+            commit_sha = _clone_with_pygit2(clone_url, ref, target_dir, depth)
+        else:
+            commit_sha = _clone_with_git_cli(clone_url, ref, target_dir, depth)
         return {
             "ok": True,
             "workdir": str(target_path),
@@ -119,6 +226,94 @@ def gh_clone_at_ref(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
         return {"ok": False, "error": str(e)}
 
 
+def _clone_with_git_cli(clone_url: str, ref: str, target_dir: str, depth: Optional[int]) -> str:
+    """Clone and check out `ref` using the git binary; returns the HEAD commit SHA."""
+    clone_url = _with_github_token_in_url(clone_url)
+    clone_cmd = ["clone"]
+    if depth:
+        clone_cmd += ["--depth", str(int(depth))]
+    clone_cmd += [clone_url, target_dir]
+    _run_git(clone_cmd)
+
+    try:
+        _run_git(["-C", target_dir, "checkout", ref])
+    except Exception:
+        # Fetch the ref explicitly then retry.
+        _run_git(["-C", target_dir, "fetch", "--all", "--tags"])
+        _run_git(["-C", target_dir, "checkout", ref])
+
+    return _run_git(["-C", target_dir, "rev-parse", "HEAD"])
+
+
+def _clone_with_pygit2(clone_url: str, ref: str, target_dir: str, depth: Optional[int]) -> str:
+    """Clone and check out `ref` in-process with libgit2; returns the HEAD commit SHA.
+
+    Mirrors `git checkout <ref>`: local branches are checked out as-is, remote
+    branches get a local tracking branch, anything else (tags, SHAs) is checked
+    out as a detached HEAD.
+    """
+    callbacks = None
+    token = settings.github_token
+    if token and clone_url.startswith("https://"):
+        callbacks = pygit2.RemoteCallbacks(credentials=pygit2.UserPass("x-access-token", token))
+
+    repo = pygit2.clone_repository(
+        clone_url, target_dir, callbacks=callbacks, depth=int(depth) if depth else 0
+    )
+
+    def resolve() -> Optional[Any]:
+        for candidate in (ref, f"origin/{ref}"):
+            try:
+                return repo.revparse_single(candidate)
+            except (KeyError, ValueError):
+                continue
+        return None
+
+    target = resolve()
+    if target is None:
+        # Fetch the ref explicitly then retry.
+        repo.remotes["origin"].fetch(callbacks=callbacks)
+        target = resolve()
+        if target is None:
+            raise ValueError(f"Unknown ref: {ref}")
+    commit = target.peel(pygit2.Commit)
+
+    local_branch = repo.lookup_branch(ref)
+    remote_branch = repo.lookup_branch(f"origin/{ref}", pygit2.GIT_BRANCH_REMOTE)
+    if local_branch is None and remote_branch is not None:
+        local_branch = repo.branches.local.create(ref, commit)
+        local_branch.upstream = remote_branch
+
+    if local_branch is not None:
+        repo.checkout(local_branch)
+    else:
+        repo.checkout_tree(commit)
+        repo.set_head(commit.id)
+
+    return str(repo.head.target)
+
+
+@lru_cache(maxsize=128)
+def _resolved_root_abs(workdir: str) -> str:
+    return os.path.realpath(workdir)
+
+
+def _resolved_root(workdir: str) -> str:
+    """Resolve a repository root once per distinct workdir.
+
+    Keyed on the absolute path so a relative workdir still follows the cwd.
+    """
+    return _resolved_root_abs(os.path.abspath(workdir))
+
+
+def _is_within(root: str, path: str) -> bool:
+    """Return True if resolved `path` is `root` or lies underneath it."""
+    try:
+        return os.path.commonpath([root, path]) == root
+    except ValueError:  # e.g. different drives on Windows
+        return False
+
+
 def gh_read_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     """
     Read a file from a local git repository.
@@ -141,22 +336,32 @@ def gh_read_file(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
         file_path = args["file_path"]
         encoding = args.get("encoding", "utf-8")
 
-        repo_root = Path(workdir).resolve()
-        full_path = (repo_root / file_path).resolve()
-        if repo_root not in full_path.parents and repo_root != full_path:
+        repo_root = _resolved_root(workdir)
+        full_path = os.path.realpath(os.path.join(repo_root, file_path))
+        if not _is_within(repo_root, full_path):
             raise ValueError("file_path escapes workdir")
 
-        content = full_path.read_text(encoding=encoding)
+        # One open (read() sizes its buffer from fstat) instead of read_text + stat
+        with open(full_path, "rb") as f:
+            data = f.read()
+        # Normalize line endings as the text-mode read did
+        content = data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
         return {
             "ok": True,
             "content": content,
-            "path": str(full_path),
-            "size": full_path.stat().st_size,
+            "path": full_path,
+            "size": len(data),
         }
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
 
+def _tree_entry(entry: os.DirEntry, rel: str) -> Dict[str, Any]:
+    if entry.is_symlink():
+        return {"path": rel, "type": "symlink", "size": 0}
+    return {"path": rel, "type": "file", "size": entry.stat(follow_symlinks=False).st_size}
+
+
 def gh_list_tree(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     """
     List files in a directory tree within a repository.
@@ -171,54 +376,67 @@ def gh_list_tree(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     Returns:
         Dictionary containing:
             - ok: bool - Success status
-            - files: List[Dict] - List of files with path, type, and size
+            - files: List[Dict] - List of files with path, type ("file", "dir" or
+              "symlink"), and size
             - count: int - Total number of files
     """
     try:
-        workdir = Path(args["workdir"]).resolve()
+        root = _resolved_root(args["workdir"])
         path = args.get("path", ".")
         recursive = bool(args.get("recursive", False))
         pattern = args.get("pattern")
+        matches = glob_matcher(pattern) if pattern else None
 
-        start = (workdir / path).resolve()
-        if workdir not in start.parents and workdir != start:
+        start_path = os.path.realpath(os.path.join(root, path))
+        if not _is_within(root, start_path):
             raise ValueError("path escapes workdir")
-        if not start.exists():
-            raise FileNotFoundError(str(start))
+        if not os.path.exists(start_path):
+            raise FileNotFoundError(start_path)
 
+        # Every listed path starts with root + separator, so relative paths are
+        # plain string slices
+        prefix_len = len(os.path.join(root, ""))
         results: List[Dict[str, Any]] = []
 
-        if start.is_file():
-            rel = str(start.relative_to(workdir))
-            if not pattern or fnmatch.fnmatch(rel, pattern):
-                results.append({"path": rel, "type": "file", "size": start.stat().st_size})
+        if os.path.isfile(start_path):
+            rel = start_path[prefix_len:]
+            if not matches or matches(rel):
+                results.append({"path": rel, "type": "file", "size": os.stat(start_path).st_size})
             return {"ok": True, "files": results, "count": len(results)}
 
         if recursive:
-            for root, dirs, files in os.walk(start):
-                root_path = Path(root)
-                for name in files:
-                    fp = root_path / name
-                    rel = str(fp.relative_to(workdir))
-                    if pattern and not fnmatch.fnmatch(rel, pattern):
+            # Top-down walk (same order as os.walk: files, then dirs, per directory),
+            # using each scandir entry's cached type and lstat instead of re-stat'ing.
+            # Symlinks are reported as such and never followed.
+            stack = [start_path]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as it:
+                        entries = list(it)
+                except OSError:
+                    continue
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+                        continue
+                    rel = entry.path[prefix_len:]
+                    if matches and not matches(rel):
                         continue
-                    results.append({"path": rel, "type": "file", "size": fp.stat().st_size})
-                for name in dirs:
-                    dp = root_path / name
-                    rel = str(dp.relative_to(workdir))
+                    results.append(_tree_entry(entry, rel))
+                for entry in subdirs:
+                    rel = entry.path[prefix_len:]
                     results.append({"path": rel, "type": "dir", "size": 0})
+                stack.extend(e.path for e in reversed(subdirs))
         else:
-            for entry in sorted(start.iterdir(), key=lambda p: p.name):
-                rel = str(entry.relative_to(workdir))
-                if pattern and entry.is_file() and not fnmatch.fnmatch(rel, pattern):
-                    continue
-                results.append(
-                    {
-                        "path": rel,
-                        "type": "dir" if entry.is_dir() else "file",
-                        "size": 0 if entry.is_dir() else entry.stat().st_size,
-                    }
-                )
+            with os.scandir(start_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                rel = entry.path[prefix_len:]
+                if entry.is_dir(follow_symlinks=False):
+                    results.append({"path": rel, "type": "dir", "size": 0})
+                elif not matches or matches(rel):
+                    results.append(_tree_entry(entry, rel))
         return {"ok": True, "files": results, "count": len(results)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -252,17 +470,13 @@ def gh_fetch_pr_patch(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]
         api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}"
         accept = "application/vnd.github.v3.patch" if fmt == "patch" else "application/vnd.github.v3.diff"
 
-        # Fetch metadata as JSON
-        meta = requests.get(api_url, headers=_gh_headers(), timeout=60)
-        meta.raise_for_status()
-        meta_json = meta.json()
-
-        # Fetch patch/diff
-        txt = requests.get(api_url, headers=_gh_headers({"Accept": accept}), timeout=60)
-        txt.raise_for_status()
+        # Fetch metadata (JSON) and patch/diff text concurrently
+        meta_future = _HTTP_POOL.submit(_get_cached, api_url, _gh_headers())
+        patch_text, _ = _get_cached(api_url, _gh_headers({"Accept": accept}), as_text=True)
+        meta_json, _ = meta_future.result()
         return {
             "ok": True,
-            "patch": txt.text,
+            "patch": patch_text,
             "pr_number": number,
             "files_changed": meta_json.get("changed_files"),
             "additions": meta_json.get("additions"),
@@ -299,9 +513,7 @@ def gh_get_pr_details(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]
 
         owner, repo, number = _parse_pr_url(pr_url)
         api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}"
-        resp = requests.get(api_url, headers=_gh_headers(), timeout=60)
-        resp.raise_for_status()
-        pr = resp.json()
+        pr, _ = _get_cached(api_url, _gh_headers())
 
         out: Dict[str, Any] = {
             "ok": True,
@@ -322,40 +534,12 @@ def gh_get_pr_details(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]
 
         if include_comments:
             comments_url = f"https://api.github.com/repos/{owner}/{repo}/issues/{number}/comments"
-            comments = []
-            page = 1
-            while True:
-                c = requests.get(
-                    comments_url,
-                    headers=_gh_headers(),
-                    params={"per_page": 100, "page": page},
-                    timeout=60,
-                )
-                c.raise_for_status()
-                batch = c.json()
-                comments.extend(batch)
-                if len(batch) < 100:
-                    break
-                page += 1
+            comments = _paginate(comments_url)
             out["comments"] = comments
 
         if include_reviews:
             reviews_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}/reviews"
-            reviews = []
-            page = 1
-            while True:
-                r = requests.get(
-                    reviews_url,
-                    headers=_gh_headers(),
-                    params={"per_page": 100, "page": page},
-                    timeout=60,
-                )
-                r.raise_for_status()
-                batch = r.json()
-                reviews.extend(batch)
-                if len(batch) < 100:
-                    break
-                page += 1
+            reviews = _paginate(reviews_url)
             out["reviews"] = reviews
 
         return out
@@ -382,30 +566,16 @@ def gh_get_file_changes(args: Dict[str, Any], tool_context: Any) -> Dict[str, An
         owner, repo, number = _parse_pr_url(pr_url)
         files_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}/files"
 
-        files: List[Dict[str, Any]] = []
-        page = 1
-        while True:
-            resp = requests.get(
-                files_url,
-                headers=_gh_headers(),
-                params={"per_page": 100, "page": page},
-                timeout=60,
-            )
-            resp.raise_for_status()
-            batch = resp.json()
-            for f in batch:
-                files.append(
-                    {
-                        "path": f.get("filename"),
-                        "status": f.get("status"),
-                        "additions": f.get("additions"),
-                        "deletions": f.get("deletions"),
-                        "changes": f.get("changes"),
-                    }
-                )
-            if len(batch) < 100:
-                break
-            page += 1
+        files: List[Dict[str, Any]] = [
+            {
+                "path": f.get("filename"),
+                "status": f.get("status"),
+                "additions": f.get("additions"),
+                "deletions": f.get("deletions"),
+                "changes": f.get("changes"),
+            }
+            for f in _paginate(files_url)
+        ]
         return {"ok": True, "files": files, "total_changes": len(files)}
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -2,32 +2,238 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import atexit
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from spendmend_adk.settings import settings
 
-
+try:
+    import orjson  # C JSON parser for large API payloads; stdlib json otherwise
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Incremental JSON parser for large list responses; buffered json otherwise
+except ImportError:
+    ijson = None
+
+# Worker threads used to fan out independent Jira requests
+JIRA_HTTP_WORKERS = 8
+
+# Keep-alive connection pool shared by all Jira calls. Rate limiting (429) and
+# gateway errors on GET/PUT are retried with backoff; the last response is
+# returned as-is so raise_for_status still reports it. POST is left out: a
+# gateway error can arrive after Jira applied a comment or transition.
+# The pool is sized for the fan-out workers plus as many tool-calling threads,
+# so a full burst reuses warm connections rather than opening extra TLS
+# connections that are discarded once the pool is full.
+_ADAPTER = HTTPAdapter(
+    pool_connections=1,  # A single Jira host
+    pool_maxsize=2 * JIRA_HTTP_WORKERS,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "PUT"}),
+        raise_on_status=False,
+    ),
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+_HTTP_POOL = ThreadPoolExecutor(max_workers=JIRA_HTTP_WORKERS, thread_name_prefix="jira-http")
+atexit.register(_HTTP_POOL.shutdown, wait=False)
+
+# Shared stand-in for absent nested objects; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+JIRA_CACHE_MAX_ENTRIES = 512
+JIRA_SEARCH_PAGE_SIZE = 100
+
+# Fields jira_get_issue reports; requesting only these (rather than *all)
+# keeps custom fields and rendered content out of the response
+_DEFAULT_ISSUE_FIELDS = (
+    "summary,description,status,assignee,reporter,labels,created,updated,project,issuetype"
+)
+
+# (url, sorted params) -> (fetched at, parsed JSON) for read-only GETs
+_JIRA_CACHE: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+# Per-key locks so concurrent misses on the same key fetch it only once
+_KEY_LOCKS: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], threading.Lock] = {}
+
+# Settings are fixed for the life of the process, so URL prefixes are built once
+_JIRA_BASE_URL = (settings.jira_url or "").rstrip("/")
+_ISSUE_URL = _JIRA_BASE_URL + "/rest/api/3/issue/"
+
+
+@lru_cache(maxsize=1)
 def _jira_headers() -> Dict[str, str]:
+    # Validation errors aren't cached, so a misconfiguration is reported on every call.
+    # The returned dict is shared and must not be mutated.
     if not settings.jira_email or not settings.jira_api_token:
         raise ValueError("Missing Jira credentials (set JIRA_EMAIL and JIRA_API_KEY).")
     if not settings.jira_url:
         raise ValueError("Missing Jira URL (set JIRA_URL).")
-    return {"Accept": "application/json"}
+    # Basic auth is encoded once here rather than by requests on every call
+    token = f"{settings.jira_email}:{settings.jira_api_token}".encode("utf-8")
+    return {
+        "Accept": "application/json",
+        "Authorization": "Basic " + base64.b64encode(token).decode("ascii"),
+    }
 
 
-def _jira_auth() -> tuple[str, str]:
-    if not settings.jira_email or not settings.jira_api_token:
-        raise ValueError("Missing Jira credentials (set JIRA_EMAIL and JIRA_API_KEY).")
-    return (settings.jira_email, settings.jira_api_token)
+@lru_cache(maxsize=1)
+def _jira_json_headers() -> Dict[str, str]:
+    return {**_jira_headers(), "Content-Type": "application/json"}
 
 
 def _jira_url(path: str) -> str:
-    base = settings.jira_url.rstrip("/")
-    if not path.startswith("/"):
-        path = "/" + path
-    return base + path
+    return _JIRA_BASE_URL + (path if path.startswith("/") else "/" + path)
+
+
+def _load_json(resp: requests.Response) -> Any:
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _get_json(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    resp = _SESSION.get(url, headers=_jira_headers(), params=params, timeout=60)
+    resp.raise_for_status()
+    return _load_json(resp)
+
+
+def _get_projected(
+    url: str,
+    params: Optional[Dict[str, Any]],
+    list_key: str,
+    project: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """GET a JSON object and map `project` over the elements of its `list_key` array.
+
+    Top-level scalars (total, maxResults, ...) are kept as-is. With ijson
+    installed the body is parsed as it arrives, so only one raw element is
+    held in memory at a time instead of the whole document.
+    """
+    if ijson is None:
+        data = _get_json(url, params)
+        out = {k: v for k, v in data.items() if k != list_key}
+        out[list_key] = [project(item) for item in (data.get(list_key) or [])]
+        return out
+
+    with _SESSION.get(url, headers=_jira_headers(), params=params, timeout=60, stream=True) as resp:
+        if not resp.ok:
+            # Buffer the error body so _http_error_result can read it after the stream closes
+            resp.content
+            resp.raise_for_status()
+        resp.raw.decode_content = True  # Let urllib3 undo any gzip encoding
+
+        item_prefix = list_key + ".item"
+        out: Dict[str, Any] = {list_key: []}
+        builder = None
+        # resp.raw bypasses requests' error wrapping, so map parse and
+        # transport errors onto the types the buffered path raises
+        try:
+            for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item_prefix and event == "end_map":
+                        out[list_key].append(project(builder.value))
+                        builder = None
+                elif prefix == item_prefix and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif "." not in prefix and event in ("number", "string", "boolean", "null"):
+                    out[prefix] = value
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in Jira response: {e}") from e
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.ConnectionError(e) from e
+        return out
+
+
+def _cached_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    loader: Optional[Callable[[str, Optional[Dict[str, Any]]], Any]] = None,
+) -> Any:
+    """GET a Jira resource as JSON, reusing a recent response for the same request.
+
+    Responses are kept for `settings.jira_cache_ttl_seconds` (0 disables the
+    cache) and dropped early by `_invalidate` when a tool changes the issue.
+    The returned object is shared between callers and must not be mutated.
+    `loader` replaces `_get_json` for fetching; a URL must always be read
+    with the same loader since the cache key doesn't include it.
+    """
+    load = loader or _get_json
+    ttl = settings.jira_cache_ttl_seconds
+    if ttl <= 0:
+        return load(url, params)
+
+    key = (url, tuple(sorted((params or {}).items())))
+    with _CACHE_LOCK:
+        hit = _JIRA_CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        key_lock = _KEY_LOCKS.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _CACHE_LOCK:
+            hit = _JIRA_CACHE.get(key)
+            if hit and time.monotonic() - hit[0] < ttl:
+                return hit[1]  # Filled by a concurrent caller while we waited
+
+        try:
+            data = load(url, params)
+
+            with _CACHE_LOCK:
+                now = time.monotonic()
+                if len(_JIRA_CACHE) >= JIRA_CACHE_MAX_ENTRIES:
+                    for stale in [k for k, (ts, _) in _JIRA_CACHE.items() if now - ts >= ttl]:
+                        del _JIRA_CACHE[stale]
+                    if len(_JIRA_CACHE) >= JIRA_CACHE_MAX_ENTRIES:
+                        del _JIRA_CACHE[min(_JIRA_CACHE, key=lambda k: _JIRA_CACHE[k][0])]
+                _JIRA_CACHE[key] = (now, data)
+        finally:
+            # Also on a failed load, or locks for erroring requests would pile up
+            with _CACHE_LOCK:
+                _KEY_LOCKS.pop(key, None)
+    return data
+
+
+def _invalidate(issue_key: str) -> None:
+    """Drop cached responses an update to `issue_key` may have made stale.
+
+    That is everything under the issue's own URL plus all searches, whose
+    results include the issue's status and assignee.
+    """
+    marker = f"/issue/{issue_key}"
+    with _CACHE_LOCK:
+        for key in list(_JIRA_CACHE):
+            url = key[0]
+            if url.endswith(marker) or marker + "/" in url or "/search" in url:
+                del _JIRA_CACHE[key]
+
+
+def _http_error_result(e: requests.HTTPError) -> Dict[str, Any]:
+    # Jira's error body ({"errorMessages": [...], "errors": {...}}) says more than the status line
+    resp = e.response
+    if resp is None:
+        return {"ok": False, "error": str(e)}
+    return {"ok": False, "status": resp.status_code, "error": (resp.text or str(e))[:500]}
 
 
 def _text_to_adf_doc(text: str) -> Dict[str, Any]:
@@ -44,6 +250,140 @@ def _text_to_adf_doc(text: str) -> Dict[str, Any]:
     }
 
 
+def _project_search_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    # Runs once per search hit. Missing nested objects fall back to a shared
+    # empty dict; Jira omits null fields, so lookups stay .get.
+    fields = issue.get("fields") or _EMPTY
+    return {
+        "key": issue.get("key"),
+        "summary": fields.get("summary") or "",
+        "status": (fields.get("status") or _EMPTY).get("name"),
+        "assignee": (fields.get("assignee") or _EMPTY).get("displayName"),
+        "updated": fields.get("updated"),
+        "created": fields.get("created"),
+        "issue_type": (fields.get("issuetype") or _EMPTY).get("name"),
+        "project": (fields.get("project") or _EMPTY).get("key"),
+    }
+
+
+def _project_comment(com: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": com.get("id"),
+        "author": ((com.get("author") or {}).get("displayName")),
+        "created": com.get("created"),
+        "updated": com.get("updated"),
+        "body": com.get("body"),
+    }
+
+
+def _search_page(url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return _get_projected(url, params, "issues", _project_search_issue)
+
+
+def _comments_page(url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return _get_projected(url, params, "comments", _project_comment)
+
+
+# Serialized {"body": <ADF doc>} comment payload around the JSON-encoded text,
+# so posting a comment doesn't rebuild and re-serialize the nested doc
+_ADF_COMMENT_PREFIX = (
+    b'{"body":{"type":"doc","version":1,"content":'
+    b'[{"type":"paragraph","content":[{"type":"text","text":'
+)
+_ADF_COMMENT_SUFFIX = b"}]}]}}"
+
+
+def _adf_comment_payload(text: str) -> bytes:
+    return _ADF_COMMENT_PREFIX + json.dumps(text).encode("ascii") + _ADF_COMMENT_SUFFIX
+
+
+def _transitions_index(url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fetch an issue's transitions keyed by id and by lower-cased name."""
+    transitions = _get_json(url, params).get("transitions") or []
+    index: Dict[str, Dict[str, Any]] = {}
+    for t in transitions:
+        index[(t.get("name") or "").lower()] = t
+    for t in transitions:
+        index[str(t.get("id"))] = t  # An id wins over a transition named like one
+    return {"index": index, "names": [t.get("name") for t in transitions]}
+
+
+def _approximate_count(url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    # POST-only endpoint; routed through _cached_get as a loader so it shares
+    # the search TTL and is dropped with other /search entries by _invalidate
+    resp = _SESSION.post(url, headers=_jira_json_headers(), json=params, timeout=60)
+    resp.raise_for_status()
+    return _load_json(resp)
+
+
+def _search_by_token(
+    base_params: Dict[str, Any], max_results: int, page_size: int, max_pages: Optional[int]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Page through /search/jql, which chains pages by nextPageToken.
+
+    The endpoint doesn't report a total, so when more pages exist the
+    approximate-count endpoint is queried alongside the remaining pages.
+    """
+    url = _jira_url("/rest/api/3/search/jql")
+    params = {**base_params, "maxResults": page_size}
+    issues: List[Dict[str, Any]] = []
+    count_future = None
+    pages = 0
+    while True:
+        data = _cached_get(url, params, _search_page)
+        issues.extend(data.get("issues", []))
+        pages += 1
+        token = data.get("nextPageToken")
+        if not token or data.get("isLast"):
+            break
+        if count_future is None:
+            count_future = _HTTP_POOL.submit(
+                _cached_get,
+                _jira_url("/rest/api/3/search/approximate-count"),
+                {"jql": base_params["jql"]},
+                _approximate_count,
+            )
+        if len(issues) >= max_results or (max_pages is not None and pages >= max_pages):
+            break
+        params = {**base_params, "maxResults": page_size, "nextPageToken": token}
+
+    total = len(issues)
+    if count_future is not None:
+        try:
+            total = max(total, int(count_future.result().get("count", total)))
+        except (requests.RequestException, ValueError):
+            pass  # The count is best-effort; report what was fetched
+    return issues, total
+
+
+def _search_by_offset(
+    base_params: Dict[str, Any], max_results: int, page_size: int, max_pages: Optional[int]
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Page through the legacy /search endpoint by startAt."""
+    search_url = _jira_url("/rest/api/3/search")
+    data = _cached_get(search_url, {**base_params, "maxResults": page_size}, _search_page)
+    issues = list(data.get("issues", []))
+
+    # The first page reports the total and the page size Jira actually
+    # honoured; fetch the remaining pages concurrently, in order.
+    total = data.get("total", len(issues))
+    page_size = data.get("maxResults") or page_size
+    wanted = min(total, max_results)
+    pages = -(-wanted // page_size)
+    if max_pages is not None:
+        pages = min(pages, max_pages)
+    if pages > 1 and len(issues) < wanted:
+        page_params = [
+            {**base_params, "maxResults": page_size, "startAt": page * page_size}
+            for page in range(1, pages)
+        ]
+        for page_data in _HTTP_POOL.map(
+            lambda p: _cached_get(search_url, p, _search_page), page_params
+        ):
+            issues.extend(page_data.get("issues", []))
+    return issues, total
+
+
 def jira_search_assigned(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
     """
     Search for Jira issues assigned to a specific user.
@@ -54,56 +394,55 @@ def jira_search_assigned(args: Dict[str, Any], tool_context: Any) -> Dict[str, A
             - status: Optional[str] - Filter by status (e.g., "In Progress", "Open")
             - project: Optional[str] - Filter by project key
             - max_results: Optional[int] - Maximum number of results to return (default: 50)
+            - page_size: Optional[int] - Issues requested per page (default: 100; Jira may cap it)
+            - max_pages: Optional[int] - Maximum number of pages to fetch (default: no limit)
 
     Returns:
         Dictionary containing:
             - ok: bool - Success status
             - issues: List[Dict] - List of matching issues
-            - count: int - Total number of results
+            - count: int - Total number of results (Jira's approximate count when not all were fetched)
     """
     try:
         assignee = args["assignee"]
         status = args.get("status")
         project = args.get("project")
         max_results = int(args.get("max_results", 50))
+        page_size = max(1, min(int(args.get("page_size", JIRA_SEARCH_PAGE_SIZE)), max_results))
+        max_pages = args.get("max_pages")
+        if max_pages is not None:
+            max_pages = int(max_pages)
 
-        jql_parts = [f'assignee = "{assignee}"']
+        # Most selective clauses first: project narrows the search the most
+        jql_parts = []
         if project:
             jql_parts.append(f'project = "{project}"')
         if status:
             jql_parts.append(f'status = "{status}"')
+        jql_parts.append(f'assignee = "{assignee}"')
         jql = " AND ".join(jql_parts) + " ORDER BY updated DESC"
 
-        resp = requests.get(
-            _jira_url("/rest/api/3/search"),
-            headers=_jira_headers(),
-            auth=_jira_auth(),
-            params={
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": "summary,status,assignee,updated,created,issuetype,project",
-            },
-            timeout=60,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        issues = []
-        for issue in data.get("issues", []):
-            fields = issue.get("fields") or {}
-            issues.append(
-                {
-                    "key": issue.get("key"),
-                    "summary": (fields.get("summary") or ""),
-                    "status": ((fields.get("status") or {}).get("name")),
-                    "assignee": ((fields.get("assignee") or {}).get("displayName")),
-                    "updated": fields.get("updated"),
-                    "created": fields.get("created"),
-                    "issue_type": ((fields.get("issuetype") or {}).get("name")),
-                    "project": ((fields.get("project") or {}).get("key")),
-                }
-            )
-        return {"ok": True, "issues": issues, "count": data.get("total", len(issues))}
-    except Exception as e:
+        base_params = {
+            "jql": jql,
+            "fields": "summary,status,assignee,updated,created,issuetype,project",
+        }
+        try:
+            issues, total = _search_by_token(base_params, max_results, page_size, max_pages)
+        except requests.HTTPError as e:
+            # Instances without /search/jql yet still serve the legacy endpoint
+            if e.response is None or e.response.status_code != 404:
+                raise
+            issues, total = _search_by_offset(base_params, max_results, page_size, max_pages)
+
+        # Projected issues are shared with the cache; hand out copies
+        return {"ok": True, "issues": [dict(i) for i in issues[:max_results]], "count": total}
+    except requests.HTTPError as e:
+        return _http_error_result(e)
+    except requests.RequestException as e:
+        return {"ok": False, "error": f"Jira request failed: {e}"}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing required argument: {e}"}
+    except (TypeError, ValueError) as e:
         return {"ok": False, "error": str(e)}
 
 
@@ -116,11 +455,14 @@ def jira_get_issue(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
             - issue_key: str - Jira issue key (e.g., "SPEND-123")
             - include_comments: Optional[bool] - Include comments (default: False)
             - include_attachments: Optional[bool] - Include attachments (default: False)
+            - fields: Optional[List[str]] - Additional field IDs to fetch (e.g. custom fields);
+              a comma-separated string is also accepted
 
     Returns:
         Dictionary containing:
             - ok: bool - Success status
-            - issue: Dict - Issue details (key, summary, description, status, assignee, etc.)
+            - issue: Dict - Issue details (key, summary, description, status, assignee, etc.);
+              additional requested fields are returned under issue["fields"]
             - comments: Optional[List[Dict]] - Comments if requested
             - attachments: Optional[List[Dict]] - Attachments if requested
     """
@@ -128,16 +470,26 @@ def jira_get_issue(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
         issue_key = args["issue_key"]
         include_comments = bool(args.get("include_comments", False))
         include_attachments = bool(args.get("include_attachments", False))
+        extra_fields = args.get("fields") or []
+        if isinstance(extra_fields, str):
+            # Also accept Jira's own comma-separated form
+            extra_fields = extra_fields.split(",")
+        extra_fields = [name for name in (str(f).strip() for f in extra_fields) if name]
 
-        resp = requests.get(
-            _jira_url(f"/rest/api/3/issue/{issue_key}"),
-            headers=_jira_headers(),
-            auth=_jira_auth(),
-            params={"fields": "*all"},
-            timeout=60,
-        )
-        resp.raise_for_status()
-        issue = resp.json()
+        requested_fields = _DEFAULT_ISSUE_FIELDS
+        if include_attachments:
+            requested_fields += ",attachment"
+        if extra_fields:
+            requested_fields += "," + ",".join(extra_fields)
+
+        # The comments GET doesn't depend on the issue, so issue both at once
+        comments_future = None
+        if include_comments:
+            comments_future = _HTTP_POOL.submit(
+                _cached_get, f"{_ISSUE_URL}{issue_key}/comment", None, _comments_page
+            )
+
+        issue = _cached_get(f"{_ISSUE_URL}{issue_key}", {"fields": requested_fields})
 
         fields = issue.get("fields") or {}
         out: Dict[str, Any] = {
@@ -157,27 +509,12 @@ def jira_get_issue(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
                 "issue_type": ((fields.get("issuetype") or {}).get("name")),
             },
         }
+        if extra_fields:
+            out["issue"]["fields"] = {name: fields.get(name) for name in extra_fields}
 
-        if include_comments:
-            c = requests.get(
-                _jira_url(f"/rest/api/3/issue/{issue_key}/comment"),
-                headers=_jira_headers(),
-                auth=_jira_auth(),
-                timeout=60,
-            )
-            c.raise_for_status()
-            comments = []
-            for com in (c.json().get("comments") or []):
-                comments.append(
-                    {
-                        "id": com.get("id"),
-                        "author": ((com.get("author") or {}).get("displayName")),
-                        "created": com.get("created"),
-                        "updated": com.get("updated"),
-                        "body": com.get("body"),
-                    }
-                )
-            out["comments"] = comments
+        if comments_future is not None:
+            # Projected entries are shared with the cache; hand out copies
+            out["comments"] = [dict(c) for c in comments_future.result().get("comments") or []]
 
         if include_attachments:
             attachments = []
@@ -196,7 +533,13 @@ def jira_get_issue(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
             out["attachments"] = attachments
 
         return out
-    except Exception as e:
+    except requests.HTTPError as e:
+        return _http_error_result(e)
+    except requests.RequestException as e:
+        return {"ok": False, "error": f"Jira request failed: {e}"}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing required argument: {e}"}
+    except (TypeError, ValueError) as e:
         return {"ok": False, "error": str(e)}
 
 
@@ -220,21 +563,27 @@ def jira_add_comment(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]:
         issue_key = args["issue_key"]
         comment = args["comment"]
 
-        payload: Dict[str, Any] = {"body": _text_to_adf_doc(comment)}
+        payload = _adf_comment_payload(comment)
         # NOTE: Jira Cloud supports comment visibility restrictions, but the exact shape depends on
         # instance permissions; leave unconfigured unless explicitly requested.
 
-        resp = requests.post(
-            _jira_url(f"/rest/api/3/issue/{issue_key}/comment"),
-            headers={**_jira_headers(), "Content-Type": "application/json"},
-            auth=_jira_auth(),
-            json=payload,
+        resp = _SESSION.post(
+            f"{_ISSUE_URL}{issue_key}/comment",
+            headers=_jira_json_headers(),
+            data=payload,
             timeout=60,
         )
+        _invalidate(issue_key)
         resp.raise_for_status()
-        data = resp.json()
+        data = _load_json(resp)
         return {"ok": True, "comment_id": data.get("id"), "message": "Comment added."}
-    except Exception as e:
+    except requests.HTTPError as e:
+        return _http_error_result(e)
+    except requests.RequestException as e:
+        return {"ok": False, "error": f"Jira request failed: {e}"}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing required argument: {e}"}
+    except (TypeError, ValueError) as e:
         return {"ok": False, "error": str(e)}
 
 
@@ -257,16 +606,22 @@ def jira_assign_issue(args: Dict[str, Any], tool_context: Any) -> Dict[str, Any]
         assignee = args.get("assignee")
         # Jira Cloud expects accountId for assignee. This tool accepts a raw string and passes it through.
         payload = {"accountId": assignee} if assignee else {"accountId": None}
-        resp = requests.put(
-            _jira_url(f"/rest/api/3/issue/{issue_key}/assignee"),
-            headers={**_jira_headers(), "Content-Type": "application/json"},
-            auth=_jira_auth(),
+        resp = _SESSION.put(
+            f"{_ISSUE_URL}{issue_key}/assignee",
+            headers=_jira_json_headers(),
             json=payload,
             timeout=60,
         )
+        _invalidate(issue_key)
         resp.raise_for_status()
         return {"ok": True, "message": "Assignee updated."}
-    except Exception as e:
+    except requests.HTTPError as e:
+        return _http_error_result(e)
+    except requests.RequestException as e:
+        return {"ok": False, "error": f"Jira request failed: {e}"}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing required argument: {e}"}
+    except (TypeError, ValueError) as e:
         return {"ok": False, "error": str(e)}
 
 
@@ -290,36 +645,32 @@ def jira_transition_issue(args: Dict[str, Any], tool_context: Any) -> Dict[str,
         transition = args["transition"]
         comment = args.get("comment")
 
-        # Get available transitions
-        tr = requests.get(
-            _jira_url(f"/rest/api/3/issue/{issue_key}/transitions"),
-            headers=_jira_headers(),
-            auth=_jira_auth(),
-            timeout=60,
-        )
-        tr.raise_for_status()
-        transitions = tr.json().get("transitions") or []
-        chosen = None
-        for t in transitions:
-            if str(t.get("id")) == str(transition) or (t.get("name") or "").lower() == str(transition).lower():
-                chosen = t
-                break
+        # Available transitions, indexed once per fetch; the cache entry is dropped
+        # by _invalidate after the transition since the options change with status
+        available = _cached_get(f"{_ISSUE_URL}{issue_key}/transitions", None, _transitions_index)
+        index = available["index"]
+        chosen = index.get(str(transition)) or index.get(str(transition).lower())
         if not chosen:
-            names = [t.get("name") for t in transitions]
-            raise ValueError(f"Transition '{transition}' not found. Available: {names}")
+            raise ValueError(f"Transition '{transition}' not found. Available: {available['names']}")
 
         payload: Dict[str, Any] = {"transition": {"id": chosen.get("id")}}
         if comment:
             payload["update"] = {"comment": [{"add": {"body": _text_to_adf_doc(comment)}}]}
 
-        do = requests.post(
-            _jira_url(f"/rest/api/3/issue/{issue_key}/transitions"),
-            headers={**_jira_headers(), "Content-Type": "application/json"},
-            auth=_jira_auth(),
+        do = _SESSION.post(
+            f"{_ISSUE_URL}{issue_key}/transitions",
+            headers=_jira_json_headers(),
             json=payload,
             timeout=60,
         )
+        _invalidate(issue_key)
         do.raise_for_status()
         return {"ok": True, "message": f"Transitioned via '{chosen.get('name')}'."}
-    except Exception as e:
+    except requests.HTTPError as e:
+        return _http_error_result(e)
+    except requests.RequestException as e:
+        return {"ok": False, "error": f"Jira request failed: {e}"}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing required argument: {e}"}
+    except (TypeError, ValueError) as e:
         return {"ok": False, "error": str(e)}
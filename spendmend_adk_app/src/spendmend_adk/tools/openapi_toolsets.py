@@ -7,18 +7,28 @@ call REST APIs without writing a bespoke tool per endpoint.
 from __future__ import annotations
 
 import base64
+import gzip
 import hashlib
 import json
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from google.adk.tools.openapi_tool.auth.auth_helpers import token_to_scheme_credential
 from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
 
 from spendmend_adk.settings import settings
+from spendmend_adk.tools.databricks_auth import resolve_databricks_token
+
+try:
+    import orjson  # C JSON parser; the GitHub spec alone is ~10 MB
+except ImportError:
+    orjson = None
 
 _JIRA_SPEC_URL = "https://developer.atlassian.com/cloud/jira/platform/swagger-v3.v3.json"
 _GITHUB_SPEC_URL = (
@@ -26,30 +36,135 @@ _GITHUB_SPEC_URL = (
     "descriptions/api.github.com/api.github.com.json"
 )
 
+# Cached specs younger than this are used without asking the server
+_SPEC_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
 
 def _cache_dir() -> Path:
     default_dir = Path(__file__).resolve().parents[3] / ".openapi_cache"
     return Path(os.getenv("OPENAPI_SPEC_CACHE_DIR", str(default_dir)))
 
 
-def _cache_path_for_url(url: str) -> Path:
+def _cache_stem_for_url(url: str) -> str:
     digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:20]
     safe_name = url.split("/")[-1] or "spec"
     safe_name = "".join(ch if ch.isalnum() or ch in ("-", "_", ".") else "_" for ch in safe_name)
-    return _cache_dir() / f"{safe_name}.{digest}.json"
+    return f"{safe_name}.{digest}"
+
+
+def _cache_path_for_url(url: str) -> Path:
+    return _cache_dir() / f"{_cache_stem_for_url(url)}.json.gz"
+
+
+def _cache_meta_path_for_url(url: str) -> Path:
+    # {"etag": ..., "last_modified": ..., "ts": <epoch seconds of last fetch/revalidation>}
+    return _cache_dir() / f"{_cache_stem_for_url(url)}.meta.json"
+
+
+def _parse_json(raw: Union[bytes, bytearray]) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_cache_meta(meta_path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
 
 
 def _load_spec_json_from_url(url: str, *, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Load an OpenAPI spec, using the gzipped on-disk copy while it is fresh.
+
+    Copies older than `_SPEC_CACHE_MAX_AGE_SECONDS` are revalidated with
+    If-None-Match/If-Modified-Since; if the server can't be reached the stale
+    copy is used rather than failing.
+    """
     cache_path = _cache_path_for_url(url)
-    if cache_path.exists():
-        return json.loads(cache_path.read_text(encoding="utf-8"))
+    meta_path = _cache_meta_path_for_url(url)
+    meta = _read_cache_meta(meta_path) if cache_path.exists() else {}
+
+    if meta and time.time() - meta.get("ts", 0) < _SPEC_CACHE_MAX_AGE_SECONDS:
+        return _parse_json(gzip.decompress(cache_path.read_bytes()))
+
+    req_headers = dict(headers or {})
+    if meta.get("etag"):
+        req_headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    # The body is streamed once: each chunk goes to the gzip writer and into a
+    # single buffer for parsing, so no str copy or second full-size bytes is made
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with requests.get(url, headers=req_headers, timeout=60, stream=True) as resp:
+            if resp.status_code == 304:
+                meta["ts"] = time.time()
+                meta_path.write_text(json.dumps(meta), encoding="utf-8")
+                return _parse_json(gzip.decompress(cache_path.read_bytes()))
+            resp.raise_for_status()
+
+            _cache_dir().mkdir(parents=True, exist_ok=True)
+            body = bytearray()
+            with gzip.open(tmp_path, "wb", compresslevel=6) as gz:
+                for chunk in resp.iter_content(chunk_size=65536):
+                    gz.write(chunk)
+                    body += chunk
+            os.replace(tmp_path, cache_path)
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "ts": time.time(),
+            }
+    except requests.RequestException:
+        tmp_path.unlink(missing_ok=True)
+        if not cache_path.exists():
+            raise
+        return _parse_json(gzip.decompress(cache_path.read_bytes()))
 
-    resp = requests.get(url, headers=headers, timeout=60)
-    resp.raise_for_status()
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+    return _parse_json(body)
 
-    _cache_dir().mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(resp.text, encoding="utf-8")
-    return resp.json()
+
+_HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
+
+
+def _tool_name(operation_id: str) -> str:
+    # Same snake_case naming ADK applies to operationIds (getIssue -> get_issue,
+    # pulls/list-files -> pulls_list_files), which is what tool_filter matches
+    name = re.sub(r"[^a-zA-Z0-9]+", "_", operation_id)
+    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
+    name = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", name)
+    return re.sub(r"_+", "_", name).strip("_").lower()
+
+
+def _prune_spec(spec: Dict[str, Any], tool_filter: List[str]) -> Dict[str, Any]:
+    """Return a shallow copy of `spec` whose paths only hold operations in `tool_filter`.
+
+    OpenAPIToolset parses every operation before applying its filter, so this
+    keeps it from walking the rest of a large spec. Path-level keys such as
+    shared `parameters` are kept for retained paths. If nothing matches (e.g.
+    the spec renamed its operations) the full spec is returned unchanged.
+    """
+    keep = set(tool_filter)
+    paths: Dict[str, Any] = {}
+    for path, item in (spec.get("paths") or {}).items():
+        if not isinstance(item, dict):
+            continue
+        ops = {
+            method: op
+            for method, op in item.items()
+            if method in _HTTP_METHODS
+            and isinstance(op, dict)
+            and _tool_name(op.get("operationId") or "") in keep
+        }
+        if ops:
+            shared = {k: v for k, v in item.items() if k not in _HTTP_METHODS}
+            paths[path] = {**shared, **ops}
+    if not paths:
+        return spec
+    return {**spec, "paths": paths}
 
 
 def _jira_basic_auth_header_value(email: str, api_token: str) -> str:
@@ -63,36 +178,12 @@ def _normalize_host(url: str) -> str:
 
 
 def _resolve_databricks_host_and_token() -> Tuple[str, str]:
-    """Resolve Databricks host+token.
-
-    Preference order:
-      1) WorkspaceClient(profile=...) if databricks-sdk is installed
-      2) Explicit env token (DATABRICKS_TOKEN/DBX_TOKEN)
-    """
+    """Resolve Databricks host+token (token resolution: see `resolve_databricks_token`)."""
 
     host = settings.databricks_host
     if not host:
         raise ValueError("Missing Databricks host (set DATABRICKS_HOST).")
-    host = _normalize_host(host)
-
-    profile = settings.databricks_profile
-    if profile:
-        try:
-            from databricks.sdk import WorkspaceClient  # type: ignore
-
-            client = WorkspaceClient(profile=profile)
-            token = getattr(getattr(client, "config", None), "token", None)
-            if token:
-                return host, token
-        except Exception:
-            pass
-
-    token = settings.databricks_token
-    if not token:
-        raise ValueError(
-            "Missing Databricks token (set DATABRICKS_TOKEN) and unable to resolve from profile."
-        )
-    return host, token
+    return _normalize_host(host), resolve_databricks_token()
 
 
 def _databricks_sql_minimal_spec(host: str) -> Dict[str, Any]:
@@ -212,6 +303,7 @@ def jira_openapi_toolset() -> OpenAPIToolset:
 
     # tool_filter expects *unprefixed* tool names; ADK applies tool_name_prefix at runtime.
     tool_filter = ["get_issue", "add_comment", "search_for_issues_using_jql", "get_remote_issue_links"]
+    spec = _prune_spec(spec, tool_filter)
     return OpenAPIToolset(
         spec_dict=spec,
         auth_scheme=auth_scheme,
@@ -242,6 +334,7 @@ def github_openapi_toolset() -> OpenAPIToolset:
         "repos_get_commit",
         "repos_compare_commits",
     ]
+    spec = _prune_spec(spec, tool_filter)
     return OpenAPIToolset(
         spec_dict=spec,
         auth_scheme=auth_scheme,
@@ -273,13 +366,18 @@ def databricks_sql_openapi_toolset() -> OpenAPIToolset:
 def openapi_toolsets_for_agents() -> List[OpenAPIToolset]:
     """Convenience: OpenAPIToolset instances to expose to agents.
 
-    ADK will call `await toolset.get_tools(...)` at runtime.
+    ADK will call `await toolset.get_tools(...)` at runtime. The builders are
+    independent (each fetches and parses its own spec), so they run concurrently;
+    results keep the builder order.
     """
+    builders = (jira_openapi_toolset, github_openapi_toolset, databricks_sql_openapi_toolset)
     toolsets: List[OpenAPIToolset] = []
-    for builder in (jira_openapi_toolset, github_openapi_toolset, databricks_sql_openapi_toolset):
-        try:
-            toolsets.append(builder())
-        except Exception:
-            # Keep agent importable even if an API isn't configured in the environment.
-            continue
+    with ThreadPoolExecutor(max_workers=len(builders), thread_name_prefix="openapi-spec") as pool:
+        futures = [pool.submit(builder) for builder in builders]
+        for future in futures:
+            try:
+                toolsets.append(future.result())
+            except Exception:
+                # Keep agent importable even if an API isn't configured in the environment.
+                continue
     return toolsets
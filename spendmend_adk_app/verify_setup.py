@@ -11,24 +11,37 @@ Run this after installation to verify:
 
 import sys
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from io import StringIO
 from pathlib import Path
 
 
-def check_python_version():
+def _entry_names(directory):
+    """Names in a directory, or an empty set if it can't be listed."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def check_python_version(out=sys.stdout):
     """Check if Python version is 3.10 or higher."""
-    print("Checking Python version...", end=" ")
+    print("Checking Python version...", end=" ", file=out)
     version = sys.version_info
     if version.major >= 3 and version.minor >= 10:
-        print(f"✓ Python {version.major}.{version.minor}.{version.micro}")
+        print(f"✓ Python {version.major}.{version.minor}.{version.micro}", file=out)
         return True
     else:
-        print(f"✗ Python {version.major}.{version.minor}.{version.micro} (requires 3.10+)")
+        print(f"✗ Python {version.major}.{version.minor}.{version.micro} (requires 3.10+)", file=out)
         return False
 
 
-def check_imports():
-    """Check if all core modules can be imported."""
-    print("\nChecking module imports...")
+def check_imports(out=sys.stdout):
+    """Check if all core modules can be found (without executing them)."""
+    print("\nChecking module imports...", file=out)
 
     modules = [
         "spendmend_adk",
@@ -44,18 +57,21 @@ def check_imports():
     all_ok = True
     for module in modules:
         try:
-            __import__(module)
-            print(f"  ✓ {module}")
+            # find_spec only locates the module (importing its parent packages),
+            # so this checks presence without running the module's own init
+            if find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
+            print(f"  ✓ {module}", file=out)
         except ImportError as e:
-            print(f"  ✗ {module}: {e}")
+            print(f"  ✗ {module}: {e}", file=out)
             all_ok = False
 
     return all_ok
 
 
-def check_dependencies():
+def check_dependencies(out=sys.stdout):
     """Check if required dependencies are installed."""
-    print("\nChecking dependencies...")
+    print("\nChecking dependencies...", file=out)
 
     dependencies = [
         "pydantic",
@@ -66,22 +82,23 @@ def check_dependencies():
     all_ok = True
     for dep in dependencies:
         try:
-            __import__(dep.replace(".", "/"))
-            print(f"  ✓ {dep}")
+            if find_spec(dep) is None:
+                raise ImportError(f"No module named '{dep}'")
+            print(f"  ✓ {dep}", file=out)
         except ImportError:
             # google.adk might not be available yet, that's okay
             if dep == "google.adk":
-                print(f"  ⚠ {dep} (optional - will be needed for execution)")
+                print(f"  ⚠ {dep} (optional - will be needed for execution)", file=out)
             else:
-                print(f"  ✗ {dep}")
+                print(f"  ✗ {dep}", file=out)
                 all_ok = False
 
     return all_ok
 
 
-def check_directory_structure():
+def check_directory_structure(out=sys.stdout):
     """Check if directory structure is correct."""
-    print("\nChecking directory structure...")
+    print("\nChecking directory structure...", file=out)
 
     base_dir = Path(__file__).parent
     required_dirs = [
@@ -96,21 +113,29 @@ def check_directory_structure():
         "src/spendmend_adk/eval",
     ]
 
+    # One scandir per parent instead of a stat per required path
+    by_parent = defaultdict(list)
+    for dir_path in required_dirs:
+        by_parent[os.path.dirname(dir_path)].append(dir_path)
+    present = set()
+    for parent, children in by_parent.items():
+        names = _entry_names(base_dir / parent)
+        present.update(c for c in children if os.path.basename(c) in names)
+
     all_ok = True
     for dir_path in required_dirs:
-        full_path = base_dir / dir_path
-        if full_path.exists():
-            print(f"  ✓ {dir_path}")
+        if dir_path in present:
+            print(f"  ✓ {dir_path}", file=out)
         else:
-            print(f"  ✗ {dir_path}")
+            print(f"  ✗ {dir_path}", file=out)
             all_ok = False
 
     return all_ok
 
 
-def check_config_files():
+def check_config_files(out=sys.stdout):
     """Check if configuration files exist."""
-    print("\nChecking configuration files...")
+    print("\nChecking configuration files...", file=out)
 
     base_dir = Path(__file__).parent
     config_files = [
@@ -120,28 +145,28 @@ def check_config_files():
         "SETUP.md",
     ]
 
+    names = _entry_names(base_dir)
+
     all_ok = True
     for file_name in config_files:
-        file_path = base_dir / file_name
-        if file_path.exists():
-            print(f"  ✓ {file_name}")
+        if file_name in names:
+            print(f"  ✓ {file_name}", file=out)
         else:
-            print(f"  ✗ {file_name}")
+            print(f"  ✗ {file_name}", file=out)
             all_ok = False
 
     # Check if .env exists (optional but recommended)
-    env_path = base_dir / ".env"
-    if env_path.exists():
-        print(f"  ✓ .env (configured)")
+    if ".env" in names:
+        print(f"  ✓ .env (configured)", file=out)
     else:
-        print(f"  ⚠ .env (not found - copy from .env.example)")
+        print(f"  ⚠ .env (not found - copy from .env.example)", file=out)
 
     return all_ok
 
 
-def check_schemas():
+def check_schemas(out=sys.stdout):
     """Check if all schema files are present and importable."""
-    print("\nChecking schema definitions...")
+    print("\nChecking schema definitions...", file=out)
 
     try:
         from spendmend_adk.schemas import common, dev_task, pr_baseline, review, update_plan, eval
@@ -160,14 +185,14 @@ def check_schemas():
         all_ok = True
         for name, exists in schemas:
             if exists:
-                print(f"  ✓ {name}")
+                print(f"  ✓ {name}", file=out)
             else:
-                print(f"  ✗ {name}")
+                print(f"  ✗ {name}", file=out)
                 all_ok = False
 
         return all_ok
     except ImportError as e:
-        print(f"  ✗ Failed to import schemas: {e}")
+        print(f"  ✗ Failed to import schemas: {e}", file=out)
         return False
 
 
@@ -186,13 +211,24 @@ def main():
         ("Schema Definitions", check_schemas),
     ]
 
-    results = []
-    for name, check_func in checks:
+    def run_check(check_func):
+        # Each check writes to its own buffer so output isn't interleaved
+        buf = StringIO()
         try:
-            results.append((name, check_func()))
+            return check_func(buf), buf.getvalue(), None
         except Exception as e:
-            print(f"\n✗ {name} check failed with error: {e}")
-            results.append((name, False))
+            return False, buf.getvalue(), e
+
+    # The checks are independent; run them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [(name, pool.submit(run_check, check_func)) for name, check_func in checks]
+        results = []
+        for name, future in futures:
+            passed, output, error = future.result()
+            print(output, end="")
+            if error is not None:
+                print(f"\n✗ {name} check failed with error: {error}")
+            results.append((name, passed))
 
     # Summary
     print("\n" + "=" * 70)